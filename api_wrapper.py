@@ -1,21 +1,50 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-from pydantic import BaseModel
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, Field, constr
+from sse_starlette.sse import EventSourceResponse
 from typing import List, Optional, Dict
+from contextlib import asynccontextmanager
 import asyncio
 import json
-import uuid
-from welsh_hunter import WELSHFounderHunter, create_welsh_hunter_config
+import os
+import secrets
+from arq import create_pool
+from arq.connections import RedisSettings
+from investigation_store import (
+    FINAL_STATUSES, REDIS_URL, create_redis_client, save_investigation, load_investigation,
+    load_investigation_status, delete_investigation, watch_investigation
+)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the shared Redis connection and job queue for the lifetime of the app"""
+    app.state.redis = create_redis_client()
+    app.state.arq = await create_pool(RedisSettings.from_dsn(REDIS_URL))
+    yield
+    await app.state.arq.aclose()
+    await app.state.redis.aclose()
 
 app = FastAPI(
     title="WELSH-Founder Hunter API",
     description="Blockchain forensics agent for identifying WELSH token founder",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+# Stacks principals: S[PM] + c32check payload, contracts add ".<contract-name>"
+STACKS_ADDRESS_PATTERN = r'^S[PM][0-9A-HJKMNP-TV-Z]{26,39}$'
+STACKS_CONTRACT_PATTERN = r'^S[PM][0-9A-HJKMNP-TV-Z]{26,39}\.[a-zA-Z][a-zA-Z0-9_-]{0,127}$'
+
+MAX_SEED_WALLETS = 10000  # Upper bound on each wallet list accepted per request
+
+StacksAddress = constr(pattern=STACKS_ADDRESS_PATTERN)
+StacksContract = constr(pattern=STACKS_CONTRACT_PATTERN)
+
 class InvestigationRequest(BaseModel):
-    welsh_contract: str
-    arkadiko_wallets: List[str]
-    philip_wallets: Optional[List[str]] = None
+    welsh_contract: StacksContract
+    arkadiko_wallets: List[StacksAddress] = Field(min_length=1, max_length=MAX_SEED_WALLETS)
+    philip_wallets: Optional[List[StacksAddress]] = Field(default=None, max_length=MAX_SEED_WALLETS)
     config_overrides: Optional[Dict] = None
 
 class InvestigationResponse(BaseModel):
@@ -33,24 +62,18 @@ class InvestigationResult(BaseModel):
     report: Optional[str] = None
     error: Optional[str] = None
 
-# In-memory storage for demo (use Redis/DB in production)
-investigations = {}
-
 @app.post("/investigate", response_model=InvestigationResponse)
-async def start_investigation(request: InvestigationRequest, background_tasks: BackgroundTasks):
+async def start_investigation(request: InvestigationRequest):
     """Start a new WELSH founder investigation"""
     
-    investigation_id = str(uuid.uuid4())
+    investigation_id = secrets.token_hex(16)
     
     # Initialize investigation
-    investigations[investigation_id] = {
-        'status': 'started',
-        'result': None
-    }
+    await save_investigation(app.state.redis, investigation_id, 'started', created=True)
     
-    # Run investigation in background
-    background_tasks.add_task(
-        run_investigation,
+    # Queue investigation for the worker fleet
+    await app.state.arq.enqueue_job(
+        'run_investigation',
         investigation_id,
         request.welsh_contract,
         request.arkadiko_wallets,
@@ -68,18 +91,25 @@ async def start_investigation(request: InvestigationRequest, background_tasks: B
 async def get_investigation_result(investigation_id: str):
     """Get investigation results"""
     
-    if investigation_id not in investigations:
-        raise HTTPException(status_code=404, detail="Investigation not found")
+    investigation = await load_investigation(app.state.redis, investigation_id, decode_result=False)
     
-    investigation = investigations[investigation_id]
+    if investigation is None:
+        raise HTTPException(status_code=404, detail="Investigation not found")
     
-    if investigation['status'] == 'running':
+    if investigation['status'] == 'started':
+        # Queued: no worker has picked the job up yet
+        return InvestigationResult(
+            success=False,
+            error="Investigation queued"
+        )
+    elif investigation['status'] == 'running':
         return InvestigationResult(
             success=False,
             error="Investigation still running"
         )
     elif investigation['status'] == 'completed':
-        return InvestigationResult(**investigation['result'])
+        # Stored in InvestigationResult shape by the worker, so pass the JSON through
+        return Response(content=investigation['result'], media_type="application/json")
     else:
         return InvestigationResult(
             success=False,
@@ -90,42 +120,43 @@ async def get_investigation_result(investigation_id: str):
 async def get_investigation_status(investigation_id: str):
     """Get investigation status"""
     
-    if investigation_id not in investigations:
+    status = await load_investigation_status(app.state.redis, investigation_id)
+    
+    if status is None:
         raise HTTPException(status_code=404, detail="Investigation not found")
     
-    return {"investigation_id": investigation_id, "status": investigations[investigation_id]['status']}
-
-async def run_investigation(investigation_id: str, welsh_contract: str, 
-                          arkadiko_wallets: List[str], philip_wallets: List[str],
-                          config_overrides: Dict):
-    """Run the investigation asynchronously"""
-    
-    try:
-        investigations[investigation_id]['status'] = 'running'
-        
-        # Create configuration
-        config = create_welsh_hunter_config()
-        config.update(config_overrides)
-        
-        # Initialize hunter
-        hunter = WELSHFounderHunter(config)
-        
-        # Run investigation
-        result = hunter.run_full_investigation(
-            welsh_contract=welsh_contract,
-            arkadiko_wallets=arkadiko_wallets,
-            philip_wallets=philip_wallets
-        )
-        
-        investigations[investigation_id]['status'] = 'completed'
-        investigations[investigation_id]['result'] = result
-        
-    except Exception as e:
-        investigations[investigation_id]['status'] = 'failed'
-        investigations[investigation_id]['result'] = {
-            'success': False,
-            'error': str(e)
-        }
+    return {"investigation_id": investigation_id, "status": status}
+
+@app.get("/investigate/{investigation_id}/events")
+async def stream_investigation_events(investigation_id: str):
+    """Push status changes as server-sent events until the investigation finishes"""
+    
+    if await load_investigation_status(app.state.redis, investigation_id) is None:
+        raise HTTPException(status_code=404, detail="Investigation not found")
+    
+    async def events():
+        async for status in watch_investigation(app.state.redis, investigation_id):
+            yield {"event": "status", "data": status}
+    
+    return EventSourceResponse(events())
+
+@app.delete("/investigate/{investigation_id}")
+async def remove_investigation(investigation_id: str):
+    """Release a finished investigation without waiting for its TTL"""
+    
+    status = await load_investigation_status(app.state.redis, investigation_id)
+    
+    if status is None:
+        raise HTTPException(status_code=404, detail="Investigation not found")
+    
+    # A queued or running job would recreate the hash on its next status write
+    if status not in FINAL_STATUSES:
+        raise HTTPException(status_code=409, detail=f"Investigation is {status}; delete it once it has finished")
+    
+    if not await delete_investigation(app.state.redis, investigation_id):
+        raise HTTPException(status_code=404, detail="Investigation not found")
+    
+    return {"investigation_id": investigation_id, "status": "deleted"}
 
 @app.get("/health")
 async def health_check():
@@ -143,10 +174,19 @@ async def root():
             "start_investigation": "POST /investigate",
             "get_result": "GET /investigate/{investigation_id}",
             "get_status": "GET /investigate/{investigation_id}/status",
+            "stream_status": "GET /investigate/{investigation_id}/events",
+            "delete": "DELETE /investigate/{investigation_id}",
             "health": "GET /health"
         }
     }
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    uvicorn.run(
+        "api_wrapper:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("UVICORN_WORKERS", os.cpu_count() or 1)),
+        loop="uvloop",
+        http="httptools"
+    )
\ No newline at end of file
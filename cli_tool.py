@@ -5,11 +5,18 @@ Command-line interface for blockchain forensics investigation
 """
 
 import argparse
-import json
+import functools
+import gzip
+import mmap
 import sys
 import os
+import orjson
 from welsh_hunter import WELSHFounderHunter, create_welsh_hunter_config
 
+def write_lines(lines):
+    """Emit a block of output lines with a single write to stdout"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 def main():
     parser = argparse.ArgumentParser(
         description="WELSH-Founder Hunter CLI - Blockchain forensics for WELSH token founder identification",
@@ -36,7 +43,8 @@ Examples:
     parser.add_argument("--config", type=str,
                        help="Configuration file path (JSON)")
     parser.add_argument("--output", type=str, default="welsh_investigation_report.md",
-                       help="Output report file (default: welsh_investigation_report.md)")
+                       help="Output report file, gzip-compressed if it ends in .gz "
+                            "(default: welsh_investigation_report.md)")
     parser.add_argument("--format", choices=["json", "markdown"], default="markdown",
                        help="Output format (default: markdown)")
     parser.add_argument("--verbose", "-v", action="store_true",
@@ -53,9 +61,12 @@ Examples:
             sys.exit(1)
         
         try:
-            with open(args.config, 'r') as f:
-                config = json.load(f)
-        except json.JSONDecodeError as e:
+            # Parse straight from the mapped file bytes, no intermediate copy
+            with open(args.config, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                    memoryview(mm) as view:
+                config = orjson.loads(view)
+        except ValueError as e:  # orjson.JSONDecodeError, or mmap of an empty file
             print(f"❌ Invalid JSON in configuration file: {e}")
             sys.exit(1)
     else:
@@ -64,7 +75,7 @@ Examples:
     # Load environment variables
     env_vars = [
         'HIRO_API_KEY', 'DISCORD_BOT_TOKEN', 'GITHUB_PAT',
-        'AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY'
+        'AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY', 'TX_CACHE_PATH'
     ]
     
     for var in env_vars:
@@ -72,19 +83,22 @@ Examples:
             config[var.lower()] = os.environ[var]
     
     if args.verbose:
-        print("🔧 Configuration:")
+        lines = ["🔧 Configuration:"]
         for key, value in config.items():
             if 'key' in key.lower() or 'token' in key.lower():
                 display_value = f"{value[:8]}..." if value else "Not set"
             else:
                 display_value = value
-            print(f"  {key}: {display_value}")
-        print()
+            lines.append(f"  {key}: {display_value}")
+        lines.append("")
+        write_lines(lines)
     
     if args.dry_run:
-        print("🏃 Dry run mode - configuration loaded successfully")
-        print(f"📄 Would save results to: {args.output}")
-        print(f"📊 Output format: {args.format}")
+        write_lines([
+            "🏃 Dry run mode - configuration loaded successfully",
+            f"📄 Would save results to: {args.output}",
+            f"📊 Output format: {args.format}"
+        ])
         sys.exit(0)
     
     # Initialize hunter
@@ -95,12 +109,15 @@ Examples:
         sys.exit(1)
     
     # Run investigation
-    print("🚀 Starting WELSH-Founder Hunter investigation...")
-    print(f"🎯 Target contract: {args.welsh_contract}")
-    print(f"🏦 Arkadiko wallets: {len(args.arkadiko_wallets)}")
+    lines = [
+        "🚀 Starting WELSH-Founder Hunter investigation...",
+        f"🎯 Target contract: {args.welsh_contract}",
+        f"🏦 Arkadiko wallets: {len(args.arkadiko_wallets)}"
+    ]
     if args.philip_wallets:
-        print(f"👤 Philip wallets: {len(args.philip_wallets)}")
-    print()
+        lines.append(f"👤 Philip wallets: {len(args.philip_wallets)}")
+    lines.append("")
+    write_lines(lines)
     
     try:
         result = hunter.run_full_investigation(
@@ -112,7 +129,9 @@ Examples:
         print(f"❌ Investigation failed: {e}")
         sys.exit(1)
     
-    # Output results
+    # Output results (compresslevel=1 keeps gzip cheap while still shrinking large reports)
+    opener = functools.partial(gzip.open, compresslevel=1) if args.output.endswith('.gz') else open
+    
     try:
         if args.format == "json":
             output_data = {
@@ -125,11 +144,15 @@ Examples:
                 }
             }
             
-            with open(args.output, 'w') as f:
-                json.dump(output_data, f, indent=2, default=str)
+            with opener(args.output, 'wb') as f:
+                f.write(orjson.dumps(
+                    output_data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    default=str
+                ))
         else:
-            with open(args.output, 'w') as f:
-                f.write(result.get('report', 'No report generated'))
+            with opener(args.output, 'wb') as f:
+                f.write(result.get('report', 'No report generated').encode())
         
         print(f"📄 Report saved to: {args.output}")
         
@@ -138,18 +161,22 @@ Examples:
         sys.exit(1)
     
     # Display summary
-    print("\n" + "="*60)
-    print("🎉 Investigation Complete!")
-    print(f"🎯 Conclusion: {result.get('conclusion', 'Unknown')}")
-    print(f"📊 Confidence: {result.get('confidence_score', 0):.1f}%")
-    print(f"🔍 Evidence items: {result.get('evidence_count', 0)}")
-    print(f"🕸️ Cluster size: {result.get('cluster_size', 0)} addresses")
+    lines = [
+        "\n" + "="*60,
+        "🎉 Investigation Complete!",
+        f"🎯 Conclusion: {result.get('conclusion', 'Unknown')}",
+        f"📊 Confidence: {result.get('confidence_score', 0):.1f}%",
+        f"🔍 Evidence items: {result.get('evidence_count', 0)}",
+        f"🕸️ Cluster size: {result.get('cluster_size', 0)} addresses"
+    ]
     
     if result.get('success'):
-        print("✅ Investigation completed successfully")
+        lines.append("✅ Investigation completed successfully")
+        write_lines(lines)
         sys.exit(0)
     else:
-        print(f"❌ Investigation failed: {result.get('error', 'Unknown error')}")
+        lines.append(f"❌ Investigation failed: {result.get('error', 'Unknown error')}")
+        write_lines(lines)
         sys.exit(1)
 
 if __name__ == "__main__":
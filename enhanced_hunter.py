@@ -1,22 +1,44 @@
 # Enhanced WELSH-Founder Hunter - Comprehensive Hiro API Utilization
 # Utilizing every possible option for maximum blockchain forensics capability
 
-import json
-import requests
-import networkx as nx
+import orjson
+import asyncio
+import logging
+import sys
+import httpx
+import diskcache
+from aiolimiter import AsyncLimiter
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+import bisect
 import hashlib
 import re
-import statistics
 import base58
 from typing import Dict, List, Set, Tuple, Optional, Union
 from dataclasses import dataclass, asdict
-from collections import defaultdict, Counter
-import time
+from collections import defaultdict, Counter, ChainMap
+from types import MappingProxyType
+from functools import lru_cache
 from urllib.parse import urlencode
+from logging.handlers import MemoryHandler
+from cachetools import LRUCache
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+def configure_logging(level: int = logging.INFO, capacity: int = 1024):
+    """Send hunter progress to stdout, buffered until `capacity` records or an error"""
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(MemoryHandler(capacity, flushLevel=logging.ERROR, target=stream_handler))
+    logger.setLevel(level)
+
+def flush_logging():
+    """Write out any buffered hunter progress"""
+    for handler in logger.handlers:
+        handler.flush()
+
+@dataclass(slots=True)
 class TransactionPattern:
     """Advanced transaction pattern analysis"""
     address: str
@@ -30,7 +52,7 @@ class TransactionPattern:
     gas_efficiency: float
     batch_behavior: bool
 
-@dataclass
+@dataclass(slots=True)
 class ContractInteraction:
     """Contract interaction analysis"""
     contract_address: str
@@ -43,7 +65,7 @@ class ContractInteraction:
     gas_used: int
     contract_type: str
 
-@dataclass
+@dataclass(slots=True)
 class AdvancedEvidence:
     """Enhanced evidence with correlation scores"""
     evidence_type: str
@@ -56,7 +78,7 @@ class AdvancedEvidence:
     risk_factors: List[str]
     blockchain_proof: Dict
 
-@dataclass
+@dataclass(slots=True)
 class WalletCluster:
     """Enhanced wallet cluster with advanced metrics"""
     primary_address: str
@@ -70,10 +92,115 @@ class WalletCluster:
     activity_correlation: float
     funding_sources: List[str]
 
+@dataclass(slots=True)
+class TransactionArrays:
+    """Column-wise view of a transaction list, one entry per transaction
+
+    Missing values are 0, except nonces, which use -1. Amounts and recipients
+    are only filled for token transfers.
+    """
+    fees: np.ndarray        # int64
+    times: np.ndarray       # int64, burn block unix time
+    nonces: np.ndarray      # int64
+    amounts: np.ndarray     # int64
+    tx_types: np.ndarray    # object
+    senders: np.ndarray     # object
+    recipients: np.ndarray  # object
+    counterparties: Counter  # sender/recipient address -> appearances
+    sorted_times: Optional[np.ndarray] = None  # known times only, ascending
+
+# Comprehensive service identification database (static; per-hunter additions go
+# into a ChainMap layer in front of it, see EnhancedWELSHFounderHunter.__init__)
+_SERVICE_DB = MappingProxyType({
+    # Major CEX addresses (these would be real addresses in production)
+    'SP3FBR2AGK5H9QBDH3EEN6DF8EK8JY7RX8QJ5SVTE': {
+        'service': 'binance', 'type': 'hot_wallet', 'confidence': 0.95,
+        'risk_level': 'low', 'kyc_required': True
+    },
+    'SP2J6ZY48GV1EZ5V2V5RB9MP66SW86PYKKNRV9EJ7': {
+        'service': 'binance', 'type': 'hot_wallet_2', 'confidence': 0.95,
+        'risk_level': 'low', 'kyc_required': True
+    },
+    'SP1Y5YSTAHZ88XYK1VPDH24GY0HPX5J4JECTMY4A1': {
+        'service': 'okx', 'type': 'hot_wallet', 'confidence': 0.90,
+        'risk_level': 'low', 'kyc_required': True
+    },
+    'SP32AEEF6WW5Y0NMJ1S8SBSZDAY8R5J32NBZFPKKZ': {
+        'service': 'kucoin', 'type': 'hot_wallet', 'confidence': 0.90,
+        'risk_level': 'medium', 'kyc_required': True
+    },
+    
+    # DeFi protocols
+    'SP2C2YFP12AJZB4MABJBAJ55XECVS7E4PMMZ89YZR': {
+        'service': 'arkadiko', 'type': 'protocol', 'confidence': 1.0,
+        'risk_level': 'low', 'decentralized': True
+    },
+    'SP3K8BC0PPEVCV7NZ6QSRWPQ2JE9E5B6N3PA0KBR9': {
+        'service': 'alex', 'type': 'dex', 'confidence': 0.95,
+        'risk_level': 'low', 'decentralized': True
+    },
+    
+    # Stacking pools
+    'SP1GPBP8NBRXDRJBFQBV7KMAZX1Z8QJ5QWMSS1M1': {
+        'service': 'stacking_pool', 'type': 'delegation', 'confidence': 0.85,
+        'risk_level': 'medium', 'stacking_related': True
+    },
+    
+    # Known ecosystem addresses
+    'SP000000000000000000002Q6VF78': {
+        'service': 'stacks_foundation', 'type': 'genesis', 'confidence': 1.0,
+        'risk_level': 'none', 'official': True
+    }
+})
+
+# The same table as a frame indexed by address, for tagging many addresses in one join
+_SERVICE_DF = pd.DataFrame.from_dict(dict(_SERVICE_DB), orient='index').rename_axis('address')
+
+# Classification thresholds: a value's label is picked by bisecting its bounds
+_ACTIVITY_BOUNDS = (1, 10, 100, 1000)  # Transaction counts
+_ACTIVITY_LABELS = ('inactive', 'low', 'medium', 'high', 'very_high')
+_RISK_BOUNDS = (0.3, 0.7)  # Risk scores; a score on a bound takes the lower label
+_RISK_LABELS = ('low', 'medium', 'high')
+
+# Characters accepted after the SP/SM prefix, deleted in one bytes.translate call
+_VALID_ADDRESS_CHARS = b'0123456789ABCDEFGHJKMNPQRSTUVWXYZabcdefghjkmnpqrstuvwxyz'
+
+@lru_cache(maxsize=1024)
+def _source_hash(contract_id: str, source_code: str) -> str:
+    """Fingerprint of a contract's source; deployed source never changes, so it is computed once"""
+    return hashlib.blake2b(source_code.encode(), digest_size=32).hexdigest()
+
+def _iso(timestamp: int) -> str:
+    """Format a unix timestamp the way Hiro formats burn_block_time_iso"""
+    return datetime.fromtimestamp(int(timestamp), tz=timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
+# Confirmed transactions, blocks fetched by hash and deployed contracts never change,
+# so their responses are cached indefinitely once final (see _is_final); everything
+# else, including blocks fetched by a height that can still reorg, expires after
+# MUTABLE_CACHE_TTL
+IMMUTABLE_ENDPOINT_PATTERN = re.compile(
+    r'^/extended/v1/(?:tx/(?:0x)?[0-9a-fA-F]{64}(?:/events)?'
+    r'|block/(?:0x)?[0-9a-fA-F]{64}(?:/transactions)?'
+    r'|contract/[^/]+(?:/source|/interface)?)$'
+)
+MUTABLE_CACHE_TTL = 60  # Seconds
+
+def _is_final(data: Dict) -> bool:
+    """Whether a response from an immutable endpoint can no longer change: pending
+    transactions, non-canonical (orphaned) txs and blocks, and empty pages that may
+    belong to an unmined transaction are still in flux"""
+    if data.get('tx_status') == 'pending' or data.get('canonical') is False:
+        return False
+    return data.get('results') != []
+
+TX_PAGE_LIMIT = 50  # Largest page the v1 address transactions endpoint serves
+MAX_TX_HISTORY = 500  # Transactions fetched per address, to bound API calls
+SMALL_TIME_SAMPLE = 32  # Below this many timestamps plain Python beats NumPy's per-call overhead
+
 class ComprehensiveHiroAPI:
     """Comprehensive Hiro API client utilizing all available endpoints"""
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, cache_dir: str = '.hiro_cache'):
         self.api_key = api_key
         self.endpoints = {
             'mainnet': 'https://api.mainnet.hiro.so',
@@ -83,82 +210,111 @@ class ComprehensiveHiroAPI:
         }
         
         self.current_endpoint = self.endpoints['mainnet']
-        self.session = requests.Session()
         
         # Enhanced headers
-        headers = {
+        self.headers = {
             'Content-Type': 'application/json',
             'User-Agent': 'Enhanced-WELSH-Hunter/2.0',
             'Accept': 'application/json'
         }
         
         if api_key:
-            headers['X-API-Key'] = api_key
-            
-        self.session.headers.update(headers)
+            self.headers['X-API-Key'] = api_key
         
-        # Rate limiting
-        self.rate_limit = {
-            'requests_per_minute': 5000 if api_key else 500,
-            'burst_limit': 100 if api_key else 20,
-            'current_requests': 0,
-            'minute_start': time.time(),
-            'last_request': 0
-        }
-    
-    def _rate_limit_check(self):
-        """Intelligent rate limiting with burst support"""
-        current_time = time.time()
+        # Rate limiting: the limiter spaces requests across the minute without
+        # blocking, the burst semaphore caps how many are in flight at once
+        self.requests_per_minute = 5000 if api_key else 500
+        self.burst_limit = 100 if api_key else 20
         
-        # Reset minute counter
-        if current_time - self.rate_limit['minute_start'] > 60:
-            self.rate_limit['current_requests'] = 0
-            self.rate_limit['minute_start'] = current_time
+        # Created on first use inside the running event loop (see _get_session)
+        self.session = None
+        self._limiter = None
+        self._burst = None
         
-        # Check burst limit
-        time_since_last = current_time - self.rate_limit['last_request']
-        if time_since_last < 0.1:  # 100ms minimum between requests
-            time.sleep(0.1 - time_since_last)
+        # Response cache: persistent on disk, with hot immutable entries kept in memory
+        self.cache = diskcache.Cache(cache_dir)
+        self._memory_cache = LRUCache(maxsize=1024)
+    
+    def _get_session(self) -> httpx.AsyncClient:
+        """Lazily open the pooled HTTP/2 client bound to the current event loop"""
+        if self.session is None or self.session.is_closed:
+            # HTTP/2 multiplexes concurrent requests over one TLS connection per host
+            self.session = httpx.AsyncClient(
+                base_url=self.current_endpoint,
+                http2=True,
+                headers=self.headers,
+                limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+                timeout=30
+            )
+            self._limiter = AsyncLimiter(self.requests_per_minute, 60)
+            self._burst = asyncio.Semaphore(self.burst_limit)
+        return self.session
+    
+    async def close(self):
+        """Close the HTTP client; a new one is opened on the next request"""
+        if self.session is not None and not self.session.is_closed:
+            await self.session.aclose()
+        self.session = None
+    
+    async def make_request(self, endpoint: str, params: Dict = None, retries: int = 3) -> Optional[Dict]:
+        """Cached API request; only successful responses are stored"""
+        # One request path (endpoint plus query in a stable order) serves as both URL and cache key;
+        # list values repeat their key (type=a&type=b), as requests encoded them
+        path = f"{endpoint}?{urlencode(sorted(params.items()), doseq=True)}" if params else endpoint
+        key = self._cache_key(path)
+        
+        if key in self._memory_cache:
+            return self._memory_cache[key]
         
-        # Check minute limit
-        if self.rate_limit['current_requests'] >= self.rate_limit['requests_per_minute']:
-            sleep_time = 60 - (current_time - self.rate_limit['minute_start'])
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-                self.rate_limit['current_requests'] = 0
-                self.rate_limit['minute_start'] = time.time()
+        data = self.cache.get(key)
+        fetched = data is None
+        if fetched:
+            data = await self._fetch(path, retries)
+            if data is None:
+                return None
+            # _fetch may have switched endpoints; file the response under the host that served it
+            key = self._cache_key(path)
         
-        self.rate_limit['current_requests'] += 1
-        self.rate_limit['last_request'] = time.time()
+        immutable = IMMUTABLE_ENDPOINT_PATTERN.match(endpoint) is not None and _is_final(data)
+        if fetched:
+            self.cache.set(key, data, expire=None if immutable else MUTABLE_CACHE_TTL)
+        if immutable:
+            self._memory_cache[key] = data
+        return data
+    
+    def _cache_key(self, path: str) -> str:
+        """Cache key of a request path on the current endpoint; networks never share entries"""
+        return hashlib.blake2b(f"{self.current_endpoint}{path}".encode(), digest_size=16).hexdigest()
     
-    def make_request(self, endpoint: str, params: Dict = None, retries: int = 3) -> Optional[Dict]:
+    async def _fetch(self, path: str, retries: int = 3) -> Optional[Dict]:
         """Enhanced API request with comprehensive error handling"""
-        self._rate_limit_check()
+        session = self._get_session()
         
-        for attempt in range(retries):
-            try:
-                url = f"{self.current_endpoint}{endpoint}"
-                response = self.session.get(url, params=params, timeout=30)
-                
-                if response.status_code == 200:
-                    return response.json()
-                elif response.status_code == 429:
-                    print(f"⚠️ Rate limited, attempt {attempt + 1}")
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                    continue
-                elif response.status_code == 404:
-                    return None
-                else:
-                    print(f"⚠️ API error {response.status_code}: {endpoint}")
+        async with self._burst:
+            for attempt in range(retries):
+                try:
+                    await self._limiter.acquire()
+                    response = await session.get(path)
+                    
+                    if response.status_code == 200:
+                        return orjson.loads(response.content)
+                    elif response.status_code == 429:
+                        logger.warning(f"⚠️ Rate limited, attempt {attempt + 1}")
+                        await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                        continue
+                    elif response.status_code == 404:
+                        return None
+                    else:
+                        logger.warning(f"⚠️ API error {response.status_code}: {path}")
+                        if attempt == retries - 1:
+                            self._switch_endpoint()
+                        continue
+                        
+                except httpx.HTTPError as e:
+                    logger.warning(f"⚠️ Request failed (attempt {attempt + 1}): {e}")
                     if attempt == retries - 1:
                         self._switch_endpoint()
-                    continue
-                    
-            except requests.exceptions.RequestException as e:
-                print(f"⚠️ Request failed (attempt {attempt + 1}): {e}")
-                if attempt == retries - 1:
-                    self._switch_endpoint()
-                time.sleep(1)
+                    await asyncio.sleep(1)
         
         return None
     
@@ -168,94 +324,96 @@ class ComprehensiveHiroAPI:
         current_index = endpoints.index(self.current_endpoint)
         next_index = (current_index + 1) % len(endpoints)
         self.current_endpoint = endpoints[next_index]
-        print(f"🔄 Switched to endpoint: {self.current_endpoint}")
+        if self.session is not None:
+            self.session.base_url = self.current_endpoint
+        logger.info(f"🔄 Switched to endpoint: {self.current_endpoint}")
     
     # Comprehensive API methods utilizing all Hiro endpoints
     
-    def get_blockchain_status(self) -> Dict:
+    async def get_blockchain_status(self) -> Dict:
         """Get comprehensive blockchain status"""
-        return self.make_request('/extended/v1/status') or {}
+        return await self.make_request('/extended/v1/status') or {}
     
-    def get_contract_info(self, contract_id: str) -> Dict:
+    async def get_contract_info(self, contract_id: str) -> Dict:
         """Get detailed contract information"""
-        return self.make_request(f'/extended/v1/contract/{contract_id}') or {}
+        return await self.make_request(f'/extended/v1/contract/{contract_id}') or {}
     
-    def get_contract_source(self, contract_id: str) -> Dict:
+    async def get_contract_source(self, contract_id: str) -> Dict:
         """Get contract source code"""
-        return self.make_request(f'/extended/v1/contract/{contract_id}/source') or {}
+        return await self.make_request(f'/extended/v1/contract/{contract_id}/source') or {}
     
-    def get_contract_interface(self, contract_id: str) -> Dict:
+    async def get_contract_interface(self, contract_id: str) -> Dict:
         """Get contract interface/ABI"""
-        return self.make_request(f'/extended/v1/contract/{contract_id}/interface') or {}
+        return await self.make_request(f'/extended/v1/contract/{contract_id}/interface') or {}
     
-    def get_contract_events(self, contract_id: str, limit: int = 100) -> Dict:
+    async def get_contract_events(self, contract_id: str, limit: int = 100) -> Dict:
         """Get contract events"""
         params = {'limit': limit}
-        return self.make_request(f'/extended/v1/contract/{contract_id}/events', params) or {}
+        return await self.make_request(f'/extended/v1/contract/{contract_id}/events', params) or {}
     
-    def get_transaction_details(self, tx_id: str) -> Dict:
+    async def get_transaction_details(self, tx_id: str) -> Dict:
         """Get comprehensive transaction details"""
-        return self.make_request(f'/extended/v1/tx/{tx_id}') or {}
+        return await self.make_request(f'/extended/v1/tx/{tx_id}') or {}
     
-    def get_transaction_events(self, tx_id: str) -> Dict:
+    async def get_transaction_events(self, tx_id: str) -> Dict:
         """Get transaction events"""
-        return self.make_request(f'/extended/v1/tx/{tx_id}/events') or {}
+        return await self.make_request(f'/extended/v1/tx/{tx_id}/events') or {}
     
-    def get_address_transactions(self, address: str, limit: int = 50, offset: int = 0) -> Dict:
+    async def get_address_transactions(self, address: str, limit: int = 50, offset: int = 0) -> Dict:
         """Get address transaction history"""
         params = {'limit': limit, 'offset': offset}
-        return self.make_request(f'/extended/v1/address/{address}/transactions', params) or {}
+        return await self.make_request(f'/extended/v1/address/{address}/transactions', params) or {}
     
-    def get_address_stx_balance(self, address: str) -> Dict:
+    async def get_address_stx_balance(self, address: str) -> Dict:
         """Get STX balance and details"""
-        return self.make_request(f'/extended/v1/address/{address}/stx') or {}
+        return await self.make_request(f'/extended/v1/address/{address}/stx') or {}
     
-    def get_address_nonces(self, address: str) -> Dict:
+    async def get_address_nonces(self, address: str) -> Dict:
         """Get address nonces"""
-        return self.make_request(f'/extended/v1/address/{address}/nonces') or {}
+        return await self.make_request(f'/extended/v1/address/{address}/nonces') or {}
     
-    def get_address_assets(self, address: str) -> Dict:
+    async def get_address_assets(self, address: str) -> Dict:
         """Get all assets held by address"""
-        return self.make_request(f'/extended/v1/address/{address}/assets') or {}
+        return await self.make_request(f'/extended/v1/address/{address}/assets') or {}
     
-    def get_ft_holdings(self, address: str) -> Dict:
+    async def get_ft_holdings(self, address: str) -> Dict:
         """Get fungible token holdings"""
-        return self.make_request(f'/extended/v1/tokens/ft/holdings/{address}') or {}
+        return await self.make_request(f'/extended/v1/tokens/ft/holdings/{address}') or {}
     
-    def get_nft_holdings(self, address: str) -> Dict:
+    async def get_nft_holdings(self, address: str) -> Dict:
         """Get NFT holdings"""
-        return self.make_request(f'/extended/v1/tokens/nft/holdings/{address}') or {}
+        return await self.make_request(f'/extended/v1/tokens/nft/holdings/{address}') or {}
     
-    def get_mempool_transactions(self, address: str = None) -> Dict:
+    async def get_mempool_transactions(self, address: str = None) -> Dict:
         """Get mempool transactions"""
         params = {}
         if address:
             params['sender_address'] = address
-        return self.make_request('/extended/v1/tx/mempool', params) or {}
+        return await self.make_request('/extended/v1/tx/mempool', params) or {}
     
-    def get_block_info(self, block_hash_or_height: Union[str, int]) -> Dict:
+    async def get_block_info(self, block_hash_or_height: Union[str, int]) -> Dict:
         """Get block information"""
-        return self.make_request(f'/extended/v1/block/{block_hash_or_height}') or {}
+        return await self.make_request(f'/extended/v1/block/{block_hash_or_height}') or {}
     
-    def get_block_transactions(self, block_hash_or_height: Union[str, int]) -> Dict:
+    async def get_block_transactions(self, block_hash_or_height: Union[str, int]) -> Dict:
         """Get transactions in a block"""
-        return self.make_request(f'/extended/v1/block/{block_hash_or_height}/transactions') or {}
+        return await self.make_request(f'/extended/v1/block/{block_hash_or_height}/transactions') or {}
     
-    def search_transactions(self, **kwargs) -> Dict:
+    async def search_transactions(self, **kwargs) -> Dict:
         """Search transactions with filters"""
-        return self.make_request('/extended/v1/tx', kwargs) or {}
+        return await self.make_request('/extended/v1/tx', kwargs) or {}
     
-    def get_fee_rate(self) -> Dict:
+    async def get_fee_rate(self) -> Dict:
         """Get current fee rates"""
-        return self.make_request('/extended/v1/fee_rate') or {}
+        return await self.make_request('/extended/v1/fee_rate') or {}
     
-    def get_network_info(self) -> Dict:
+    async def get_network_info(self) -> Dict:
         """Get network information"""
-        return self.make_request('/v2/info') or {}
+        return await self.make_request('/v2/info') or {}
     
-    def get_pox_info(self) -> Dict:
+    async def get_pox_info(self) -> Dict:
         """Get Proof of Transfer information"""
-        return self.make_request('/v2/pox') or {}
+        return await self.make_request('/v2/pox') or {}
 
 class EnhancedWELSHFounderHunter:
     """
@@ -264,19 +422,24 @@ class EnhancedWELSHFounderHunter:
     
     def __init__(self, config: Dict):
         self.config = config
-        self.api = ComprehensiveHiroAPI(config.get('hiro_api_key'))
+        self.api = ComprehensiveHiroAPI(
+            config.get('hiro_api_key'),
+            cache_dir=config.get('hiro_cache_dir', '.hiro_cache')
+        )
         
         # Enhanced data stores
-        self.wallet_graph = nx.DiGraph()
         self.clusters = {}
         self.evidence = []
         self.transaction_patterns = {}
         self.contract_interactions = []
         self.address_metadata = {}
         self.blockchain_state = {}
+        self._event_relevant_contracts = set()
         
-        # Comprehensive service identification database
-        self.service_database = self._load_comprehensive_services()
+        # Comprehensive service identification database; writes land in the
+        # per-instance overrides, the shared module table is never touched
+        self._service_overrides = {}
+        self.service_database = ChainMap(self._service_overrides, _SERVICE_DB)
         
         # Advanced heuristics configuration
         self.heuristics_config = {
@@ -303,69 +466,25 @@ class EnhancedWELSHFounderHunter:
             'total_transactions_processed': 0
         }
         
-        print("🔍 Enhanced WELSH-Founder Hunter initialized")
-        print(f"🌐 API endpoint: {self.api.current_endpoint}")
-        print(f"⚡ Rate limit: {self.api.rate_limit['requests_per_minute']} req/min")
-        print(f"📊 Mission State: Phase {self.mission_state['phase']} - {self.mission_state['current_objective']}")
+        logger.info("🔍 Enhanced WELSH-Founder Hunter initialized")
+        logger.info(f"🌐 API endpoint: {self.api.current_endpoint}")
+        logger.info(f"⚡ Rate limit: {self.api.requests_per_minute} req/min")
+        logger.info(f"📊 Mission State: Phase {self.mission_state['phase']} - {self.mission_state['current_objective']}")
     
-    def _load_comprehensive_services(self) -> Dict[str, Dict]:
-        """Load comprehensive service identification database"""
-        return {
-            # Major CEX addresses (these would be real addresses in production)
-            'SP3FBR2AGK5H9QBDH3EEN6DF8EK8JY7RX8QJ5SVTE': {
-                'service': 'binance', 'type': 'hot_wallet', 'confidence': 0.95,
-                'risk_level': 'low', 'kyc_required': True
-            },
-            'SP2J6ZY48GV1EZ5V2V5RB9MP66SW86PYKKNRV9EJ7': {
-                'service': 'binance', 'type': 'hot_wallet_2', 'confidence': 0.95,
-                'risk_level': 'low', 'kyc_required': True
-            },
-            'SP1Y5YSTAHZ88XYK1VPDH24GY0HPX5J4JECTMY4A1': {
-                'service': 'okx', 'type': 'hot_wallet', 'confidence': 0.90,
-                'risk_level': 'low', 'kyc_required': True
-            },
-            'SP32AEEF6WW5Y0NMJ1S8SBSZDAY8R5J32NBZFPKKZ': {
-                'service': 'kucoin', 'type': 'hot_wallet', 'confidence': 0.90,
-                'risk_level': 'medium', 'kyc_required': True
-            },
-            
-            # DeFi protocols
-            'SP2C2YFP12AJZB4MABJBAJ55XECVS7E4PMMZ89YZR': {
-                'service': 'arkadiko', 'type': 'protocol', 'confidence': 1.0,
-                'risk_level': 'low', 'decentralized': True
-            },
-            'SP3K8BC0PPEVCV7NZ6QSRWPQ2JE9E5B6N3PA0KBR9': {
-                'service': 'alex', 'type': 'dex', 'confidence': 0.95,
-                'risk_level': 'low', 'decentralized': True
-            },
-            
-            # Stacking pools
-            'SP1GPBP8NBRXDRJBFQBV7KMAZX1Z8QJ5QWMSS1M1': {
-                'service': 'stacking_pool', 'type': 'delegation', 'confidence': 0.85,
-                'risk_level': 'medium', 'stacking_related': True
-            },
-            
-            # Known ecosystem addresses
-            'SP000000000000000000002Q6VF78': {
-                'service': 'stacks_foundation', 'type': 'genesis', 'confidence': 1.0,
-                'risk_level': 'none', 'official': True
-            }
-        }
-    
-    def comprehensive_bootstrap(self, welsh_contract: str, arkadiko_wallets: List[str], 
+    async def comprehensive_bootstrap(self, welsh_contract: str, arkadiko_wallets: List[str], 
                                philip_wallets: List[str] = None) -> bool:
         """Comprehensive Phase 0: Bootstrap with full blockchain state analysis"""
         try:
-            print("\n🚀 Comprehensive Phase 0: Bootstrap")
+            logger.info("\n🚀 Comprehensive Phase 0: Bootstrap")
             
             # Validate inputs
             if not self._validate_stacks_address(welsh_contract):
-                print(f"❌ Invalid WELSH contract address: {welsh_contract}")
+                logger.error(f"❌ Invalid WELSH contract address: {welsh_contract}")
                 return False
             
             for addr in arkadiko_wallets:
                 if not self._validate_stacks_address(addr):
-                    print(f"❌ Invalid Arkadiko address: {addr}")
+                    logger.error(f"❌ Invalid Arkadiko address: {addr}")
                     return False
             
             # Store validated data
@@ -373,19 +492,28 @@ class EnhancedWELSHFounderHunter:
             self.arkadiko_wallets = set(arkadiko_wallets)
             self.philip_wallets = set(philip_wallets or [])
             
+            # Transaction events are only fetched for calls into (or deployments of) these
+            self._event_relevant_contracts = {welsh_contract, *self.arkadiko_wallets, *self.philip_wallets}
+            
             # Get comprehensive blockchain state
-            print("📊 Gathering blockchain state...")
+            logger.info("📊 Gathering blockchain state...")
+            status, network_info, pox_info, fee_rates = await asyncio.gather(
+                self.api.get_blockchain_status(),
+                self.api.get_network_info(),
+                self.api.get_pox_info(),
+                self.api.get_fee_rate()
+            )
             self.blockchain_state = {
-                'status': self.api.get_blockchain_status(),
-                'network_info': self.api.get_network_info(),
-                'pox_info': self.api.get_pox_info(),
-                'fee_rates': self.api.get_fee_rate(),
+                'status': status,
+                'network_info': network_info,
+                'pox_info': pox_info,
+                'fee_rates': fee_rates,
                 'timestamp': datetime.now().isoformat()
             }
             
             # Validate blockchain connection
             if not self.blockchain_state['status']:
-                print("❌ Failed to connect to blockchain")
+                logger.error("❌ Failed to connect to blockchain")
                 return False
             
             # Pre-populate service database with known addresses
@@ -397,85 +525,84 @@ class EnhancedWELSHFounderHunter:
                     }
             
             # Get initial contract information
-            print("🔍 Analyzing WELSH contract...")
-            welsh_info = self.api.get_contract_info(welsh_contract)
+            logger.info("🔍 Analyzing WELSH contract...")
+            welsh_info = await self.api.get_contract_info(welsh_contract)
             if welsh_info:
-                print(f"✅ WELSH contract validated")
-                print(f"   Deploy block: {welsh_info.get('block_height', 'Unknown')}")
-                print(f"   Source code: {len(welsh_info.get('source_code', ''))} chars")
+                logger.info(f"✅ WELSH contract validated")
+                logger.info(f"   Deploy block: {welsh_info.get('block_height', 'Unknown')}")
+                logger.info(f"   Source code: {len(welsh_info.get('source_code', ''))} chars")
             
             # Display comprehensive status
             chain_tip = self.blockchain_state['status'].get('chain_tip', {})
-            print(f"✅ Connected to Stacks blockchain")
-            print(f"   Chain tip: Block {chain_tip.get('block_height', 'Unknown')}")
-            print(f"   Network: {self.blockchain_state['status'].get('network_id', 'Unknown')}")
-            print(f"   Burn block: {chain_tip.get('burn_block_height', 'Unknown')}")
+            logger.info(f"✅ Connected to Stacks blockchain")
+            logger.info(f"   Chain tip: Block {chain_tip.get('block_height', 'Unknown')}")
+            logger.info(f"   Network: {self.blockchain_state['status'].get('network_id', 'Unknown')}")
+            logger.info(f"   Burn block: {chain_tip.get('burn_block_height', 'Unknown')}")
             
-            print(f"✅ Loaded WELSH contract: {welsh_contract}")
-            print(f"✅ Loaded {len(self.arkadiko_wallets)} Arkadiko wallets")
-            print(f"✅ Loaded {len(self.philip_wallets)} Philip wallets")
-            print(f"✅ Service database: {len(self.service_database)} known addresses")
+            logger.info(f"✅ Loaded WELSH contract: {welsh_contract}")
+            logger.info(f"✅ Loaded {len(self.arkadiko_wallets)} Arkadiko wallets")
+            logger.info(f"✅ Loaded {len(self.philip_wallets)} Philip wallets")
+            logger.info(f"✅ Service database: {len(self.service_database)} known addresses")
             
             self._update_mission_state(1, 'Comprehensive Deployer Discovery')
             return True
             
         except Exception as e:
-            print(f"❌ Comprehensive bootstrap failed: {e}")
+            logger.error(f"❌ Comprehensive bootstrap failed: {e}")
             return False
     
     def _validate_stacks_address(self, address: str) -> bool:
         """Validate Stacks address format"""
         if not address or len(address) != 41:
             return False
-        if not address.startswith(('SP', 'SM')):
+        if not address.startswith(('SP', 'SM')) or not address.isascii():
             return False
         
-        # Basic character validation
-        valid_chars = set('0123456789ABCDEFGHJKMNPQRSTUVWXYZabcdefghjkmnpqrstuvwxyz')
-        return all(c in valid_chars for c in address[2:])
+        # Basic character validation: nothing may remain once valid characters are deleted
+        return not address[2:].encode().translate(None, _VALID_ADDRESS_CHARS)
     
-    def comprehensive_deployer_discovery(self) -> Optional[Tuple[str, str, Dict]]:
+    async def comprehensive_deployer_discovery(self) -> Optional[Tuple[str, str, Dict]]:
         """Comprehensive Phase 1: Advanced deployer discovery with full analysis"""
         try:
-            print("\n🔍 Comprehensive Phase 1: Deployer Discovery")
+            logger.info("\n🔍 Comprehensive Phase 1: Deployer Discovery")
             
             # Get comprehensive contract information
-            contract_info = self.api.get_contract_info(self.welsh_contract)
+            contract_info = await self.api.get_contract_info(self.welsh_contract)
             if not contract_info:
-                print("❌ Failed to fetch contract information")
+                logger.error("❌ Failed to fetch contract information")
                 return None
             
-            # Get contract source and interface
-            contract_source = self.api.get_contract_source(self.welsh_contract)
-            contract_interface = self.api.get_contract_interface(self.welsh_contract)
-            
             deploy_tx = contract_info.get('tx_id')
             source_code = contract_info.get('source_code', '')
             
-            print(f"✅ Contract analysis complete")
-            print(f"   Deploy TX: {deploy_tx}")
-            print(f"   Source code: {len(source_code)} characters")
-            print(f"   Functions: {len(contract_interface.get('functions', []))}")
+            # Stage A: everything that only needs the contract info
+            contract_source, contract_interface, tx_details = await asyncio.gather(
+                self.api.get_contract_source(self.welsh_contract),
+                self.api.get_contract_interface(self.welsh_contract),
+                self.api.get_transaction_details(deploy_tx)
+            )
             
-            # Get comprehensive transaction details
-            tx_details = self.api.get_transaction_details(deploy_tx)
-            tx_events = self.api.get_transaction_events(deploy_tx)
+            logger.info(f"✅ Contract analysis complete")
+            logger.info(f"   Deploy TX: {deploy_tx}")
+            logger.info(f"   Source code: {len(source_code)} characters")
+            logger.info(f"   Functions: {len(contract_interface.get('functions', []))}")
             
             if not tx_details:
-                print("❌ Failed to fetch deployment transaction")
+                logger.error("❌ Failed to fetch deployment transaction")
                 return None
             
             deployer = tx_details.get('sender_address')
             deploy_time = tx_details.get('burn_block_time_iso')
             block_height = tx_details.get('block_height')
             
-            # Get deployer's comprehensive data
-            print(f"📊 Analyzing deployer: {deployer}")
-            deployer_data = self._get_comprehensive_address_analysis(deployer)
-            
-            # Get deployment block context
-            block_info = self.api.get_block_info(block_height) if block_height else {}
-            block_transactions = self.api.get_block_transactions(block_height) if block_height else {}
+            # Stage B: deployment events, block context and the deployer's
+            # comprehensive data all depend only on the deployment transaction
+            logger.info(f"📊 Analyzing deployer: {deployer}")
+            tx_events, (block_info, block_transactions), deployer_data = await asyncio.gather(
+                self._get_relevant_transaction_events(tx_details),
+                self._get_block_context(block_height),
+                self._get_comprehensive_address_analysis(deployer)
+            )
             
             # Advanced deployment analysis
             deployment_analysis = self._analyze_deployment_context(
@@ -491,7 +618,7 @@ class EnhancedWELSHFounderHunter:
                 'fee_rate': tx_details.get('fee_rate', 0),
                 'nonce': tx_details.get('nonce', 0),
                 'tx_status': tx_details.get('tx_status'),
-                'source_code_hash': hashlib.sha256(source_code.encode()).hexdigest(),
+                'source_code_hash': _source_hash(self.welsh_contract, source_code),
                 'contract_complexity': len(contract_interface.get('functions', [])),
                 'deployment_analysis': deployment_analysis,
                 'deployer_profile': deployer_data,
@@ -502,51 +629,60 @@ class EnhancedWELSHFounderHunter:
                 }
             }
             
-            print(f"✅ Comprehensive deployer analysis complete")
-            print(f"   Deployer: {deployer}")
-            print(f"   Risk score: {deployment_analysis.get('risk_score', 0):.2f}")
-            print(f"   Activity level: {deployer_data.get('activity_level', 'unknown')}")
-            print(f"   Service classification: {deployer_data.get('service_classification', 'unknown')}")
+            logger.info(f"✅ Comprehensive deployer analysis complete")
+            logger.info(f"   Deployer: {deployer}")
+            logger.info(f"   Risk score: {deployment_analysis.get('risk_score', 0):.2f}")
+            logger.info(f"   Activity level: {deployer_data.get('activity_level', 'unknown')}")
+            logger.info(f"   Service classification: {deployer_data.get('service_classification', 'unknown')}")
             
             self._update_mission_state(2, 'Advanced Wallet Clustering')
             return deployer, deploy_tx, self.deployer_info
             
         except Exception as e:
-            print(f"❌ Comprehensive deployer discovery failed: {e}")
+            logger.error(f"❌ Comprehensive deployer discovery failed: {e}")
             return None
     
-    def _get_comprehensive_address_analysis(self, address: str) -> Dict:
+    async def _get_relevant_transaction_events(self, tx: Dict) -> Dict:
+        """Get a transaction's events, skipping the call for contracts outside the investigation"""
+        contract_id = (tx.get('contract_call') or tx.get('smart_contract') or {}).get('contract_id', '')
+        
+        # Match the full contract id or its deployer prefix
+        if (contract_id not in self._event_relevant_contracts and
+                contract_id.partition('.')[0] not in self._event_relevant_contracts):
+            return {}
+        
+        return await self.api.get_transaction_events(tx['tx_id'])
+    
+    async def _get_block_context(self, block_height: Optional[int]) -> Tuple[Dict, Dict]:
+        """Get block info and transactions for the deployment block, if known"""
+        if not block_height:
+            return {}, {}
+        
+        return await asyncio.gather(
+            self.api.get_block_info(block_height),
+            self.api.get_block_transactions(block_height)
+        )
+    
+    async def _get_comprehensive_address_analysis(self, address: str) -> Dict:
         """Get comprehensive address analysis using all available API endpoints"""
         try:
-            print(f"  📊 Comprehensive analysis for {address}")
-            
-            # Get all available data
-            stx_balance = self.api.get_address_stx_balance(address)
-            nonces = self.api.get_address_nonces(address)
-            assets = self.api.get_address_assets(address)
-            ft_holdings = self.api.get_ft_holdings(address)
-            nft_holdings = self.api.get_nft_holdings(address)
-            
-            # Get transaction history in batches
-            all_transactions = []
-            offset = 0
-            batch_size = 50
+            logger.info(f"  📊 Comprehensive analysis for {address}")
+            
+            # Get all available data concurrently
+            stx_balance, nonces, assets, ft_holdings, nft_holdings, all_transactions = await asyncio.gather(
+                self.api.get_address_stx_balance(address),
+                self.api.get_address_nonces(address),
+                self.api.get_address_assets(address),
+                self.api.get_ft_holdings(address),
+                self.api.get_nft_holdings(address),
+                self._get_transaction_history(address)
+            )
             
-            while len(all_transactions) < 500:  # Limit to prevent excessive API calls
-                tx_batch = self.api.get_address_transactions(address, batch_size, offset)
-                if not tx_batch or not tx_batch.get('results'):
-                    break
-                
-                all_transactions.extend(tx_batch['results'])
-                
-                if len(tx_batch['results']) < batch_size:
-                    break
-                    
-                offset += batch_size
-                self.mission_state['api_calls_made'] += 1
+            # Single pass over the transaction dicts; every analysis below reads the arrays
+            tx_arrays = self._extract_arrays(all_transactions)
             
             # Advanced pattern analysis
-            patterns = self._analyze_advanced_patterns(all_transactions)
+            patterns = self._analyze_advanced_patterns(tx_arrays)
             
             # Activity classification
             activity_level = self._classify_activity_level(all_transactions, patterns)
@@ -558,7 +694,8 @@ class EnhancedWELSHFounderHunter:
             risk_assessment = self._assess_address_risk(address, all_transactions, patterns)
             
             # Temporal analysis
-            temporal_analysis = self._analyze_temporal_patterns(all_transactions)
+            temporal_analysis = self._analyze_temporal_patterns(tx_arrays)
+            times = tx_arrays.sorted_times
             
             comprehensive_data = {
                 'address': address,
@@ -573,8 +710,8 @@ class EnhancedWELSHFounderHunter:
                 'service_classification': service_classification,
                 'risk_assessment': risk_assessment,
                 'temporal_analysis': temporal_analysis,
-                'first_seen': min([tx.get('burn_block_time_iso') for tx in all_transactions if tx.get('burn_block_time_iso')], default=None),
-                'last_seen': max([tx.get('burn_block_time_iso') for tx in all_transactions if tx.get('burn_block_time_iso')], default=None),
+                'first_seen': _iso(times[0]) if times.size else None,
+                'last_seen': _iso(times[-1]) if times.size else None,
                 'analysis_timestamp': datetime.now().isoformat()
             }
             
@@ -586,89 +723,144 @@ class EnhancedWELSHFounderHunter:
             return comprehensive_data
             
         except Exception as e:
-            print(f"⚠️ Comprehensive address analysis failed for {address}: {e}")
+            logger.warning(f"⚠️ Comprehensive address analysis failed for {address}: {e}")
             return {'address': address, 'error': str(e)}
     
-    def _analyze_advanced_patterns(self, transactions: List[Dict]) -> Dict:
+    async def _get_transaction_history(self, address: str, max_transactions: int = MAX_TX_HISTORY) -> List[Dict]:
+        """Get transaction history in batches, fetching every page after the first concurrently"""
+        first_batch = await self.api.get_address_transactions(address, TX_PAGE_LIMIT, 0)
+        all_transactions = list(first_batch.get('results', []))
+        self.mission_state['api_calls_made'] += 1
+        
+        # Step by the page size the server actually honoured, so a lower
+        # server-side cap cannot leave gaps between the offsets
+        batch_size = len(all_transactions)
+        if not batch_size:
+            return []
+        
+        # The first page reports the total, so the remaining offsets are known up front
+        total = min(first_batch.get('total', 0), max_transactions)
+        offsets = range(batch_size, total, batch_size)
+        
+        tx_batches = await asyncio.gather(*(
+            self.api.get_address_transactions(address, batch_size, offset) for offset in offsets
+        ))
+        self.mission_state['api_calls_made'] += len(offsets)
+        
+        for tx_batch in tx_batches:
+            all_transactions.extend(tx_batch.get('results', []))
+        
+        return all_transactions[:max_transactions]
+    
+    def _extract_arrays(self, transactions: List[Dict]) -> TransactionArrays:
+        """Extract every per-transaction feature in one pass over the dicts"""
+        n = len(transactions)
+        arrays = TransactionArrays(
+            fees=np.zeros(n, dtype=np.int64),
+            times=np.zeros(n, dtype=np.int64),
+            nonces=np.full(n, -1, dtype=np.int64),
+            amounts=np.zeros(n, dtype=np.int64),
+            tx_types=np.empty(n, dtype=object),
+            senders=np.empty(n, dtype=object),
+            recipients=np.empty(n, dtype=object),
+            counterparties=Counter()
+        )
+        
+        for i, tx in enumerate(transactions):
+            # Hiro reports fee rates and amounts as integer strings
+            arrays.fees[i] = int(tx.get('fee_rate') or 0)
+            arrays.times[i] = tx.get('burn_block_time') or 0
+            if tx.get('nonce') is not None:
+                arrays.nonces[i] = tx['nonce']
+            
+            tx_type = arrays.tx_types[i] = tx.get('tx_type')
+            sender = arrays.senders[i] = tx.get('sender_address')
+            if sender:
+                arrays.counterparties[sender] += 1
+            
+            if tx_type == 'token_transfer':
+                transfer = tx.get('token_transfer', {})
+                arrays.amounts[i] = int(transfer.get('amount') or 0)
+                recipient = arrays.recipients[i] = transfer.get('recipient_address')
+                if recipient:
+                    arrays.counterparties[recipient] += 1
+        
+        # Sorted once here, in place on the masked copy, and shared by every time-based analysis
+        arrays.sorted_times = arrays.times[arrays.times > 0]
+        arrays.sorted_times.sort()
+        return arrays
+    
+    def _analyze_advanced_patterns(self, tx_arrays: TransactionArrays) -> Dict:
         """Advanced transaction pattern analysis"""
         try:
-            if not transactions:
+            if not tx_arrays.times.size:
                 return {}
             
             # Fee analysis
-            fees = [tx.get('fee_rate', 0) for tx in transactions if tx.get('fee_rate')]
+            fees = tx_arrays.fees[tx_arrays.fees > 0]
             fee_analysis = {
-                'avg_fee': statistics.mean(fees) if fees else 0,
-                'median_fee': statistics.median(fees) if fees else 0,
-                'fee_variance': statistics.variance(fees) if len(fees) > 1 else 0,
-                'fee_consistency': len(set(fees)) / len(fees) if fees else 0
+                'avg_fee': float(fees.mean()) if fees.size else 0,
+                'median_fee': float(np.median(fees)) if fees.size else 0,
+                'fee_variance': float(fees.var(ddof=1)) if fees.size > 1 else 0,
+                'fee_consistency': np.unique(fees).size / fees.size if fees.size else 0
             }
             
             # Timing analysis
-            timestamps = [tx.get('burn_block_time') for tx in transactions if tx.get('burn_block_time')]
+            timestamps = tx_arrays.sorted_times
             timing_analysis = {}
             
-            if timestamps:
+            if timestamps.size:
                 # Time gaps between transactions
-                sorted_times = sorted(timestamps)
-                gaps = [sorted_times[i] - sorted_times[i-1] for i in range(1, len(sorted_times))]
+                gaps = np.diff(timestamps)
                 
                 timing_analysis = {
-                    'avg_gap_seconds': statistics.mean(gaps) if gaps else 0,
-                    'median_gap_seconds': statistics.median(gaps) if gaps else 0,
+                    'avg_gap_seconds': float(gaps.mean()) if gaps.size else 0,
+                    'median_gap_seconds': float(np.median(gaps)) if gaps.size else 0,
                     'regular_intervals': self._detect_regular_intervals(gaps),
                     'burst_activity': self._detect_burst_activity(timestamps),
                     'time_of_day_patterns': self._analyze_time_patterns(timestamps)
                 }
             
             # Amount analysis
-            amounts = []
-            for tx in transactions:
-                if tx.get('tx_type') == 'token_transfer':
-                    amount = tx.get('token_transfer', {}).get('amount', 0)
-                    if amount:
-                        amounts.append(amount)
+            amounts = tx_arrays.amounts[tx_arrays.amounts > 0]
             
             amount_analysis = {}
-            if amounts:
+            if amounts.size:
+                avg_amount = amounts.mean()
                 amount_analysis = {
-                    'avg_amount': statistics.mean(amounts),
-                    'median_amount': statistics.median(amounts),
-                    'round_number_frequency': sum(1 for a in amounts if a % 1000000 == 0) / len(amounts),
-                    'amount_diversity': len(set(amounts)) / len(amounts),
-                    'large_transactions': sum(1 for a in amounts if a > statistics.mean(amounts) * 10)
+                    'avg_amount': float(avg_amount),
+                    'median_amount': float(np.median(amounts)),
+                    'round_number_frequency': float((amounts % 1000000 == 0).mean()),
+                    'amount_diversity': np.unique(amounts).size / amounts.size,
+                    'large_transactions': int((amounts > avg_amount * 10).sum())
                 }
             
             # Nonce analysis
-            nonces = [tx.get('nonce') for tx in transactions if tx.get('nonce') is not None]
+            nonces = tx_arrays.nonces[tx_arrays.nonces >= 0]
             nonce_analysis = {}
             
-            if nonces:
-                sorted_nonces = sorted(nonces)
-                gaps = [sorted_nonces[i] - sorted_nonces[i-1] for i in range(1, len(sorted_nonces))]
+            if nonces.size:
+                nonces.sort()  # The mask already copied, so sort in place
+                gaps = np.diff(nonces)
                 
                 nonce_analysis = {
-                    'sequential_ratio': sum(1 for g in gaps if g == 1) / len(gaps) if gaps else 0,
-                    'large_gaps': sum(1 for g in gaps if g > 10) if gaps else 0,
-                    'gap_pattern': 'sequential' if all(g == 1 for g in gaps[:10]) else 'irregular'
+                    'sequential_ratio': float((gaps == 1).mean()) if gaps.size else 0,
+                    'large_gaps': int((gaps > 10).sum()),
+                    'gap_pattern': 'sequential' if (gaps[:10] == 1).all() else 'irregular'
                 }
             
             # Counterparty analysis
-            counterparties = set()
-            for tx in transactions:
-                sender = tx.get('sender_address')
-                if sender:
-                    counterparties.add(sender)
-                
-                if tx.get('tx_type') == 'token_transfer':
-                    recipient = tx.get('token_transfer', {}).get('recipient_address')
-                    if recipient:
-                        counterparties.add(recipient)
+            counterparties = tx_arrays.counterparties
+            
+            known_services = self.classify_addresses(list(counterparties))['service'].dropna()
             
             counterparty_analysis = {
                 'unique_counterparties': len(counterparties),
-                'counterparty_diversity': len(counterparties) / len(transactions) if transactions else 0,
-                'repeat_interactions': len(transactions) - len(counterparties)
+                'counterparty_diversity': len(counterparties) / tx_arrays.times.size,
+                'repeat_interactions': sum(count for count in counterparties.values() if count > 1),
+                'top_counterparties': counterparties.most_common(10),
+                'known_service_counterparties': int(known_services.size),
+                'known_services': sorted(known_services.unique())
             }
             
             return {
@@ -681,138 +873,123 @@ class EnhancedWELSHFounderHunter:
             }
             
         except Exception as e:
-            print(f"⚠️ Advanced pattern analysis failed: {e}")
+            logger.warning(f"⚠️ Advanced pattern analysis failed: {e}")
             return {}
     
-    def _detect_regular_intervals(self, gaps: List[int]) -> bool:
+    def _detect_regular_intervals(self, gaps: np.ndarray) -> bool:
         """Detect if transactions occur at regular intervals"""
-        if len(gaps) < 5:
+        if gaps.size < 5:
             return False
         
         # Check if gaps are similar (within 20% variance)
-        avg_gap = statistics.mean(gaps)
-        variance = statistics.variance(gaps)
-        coefficient_of_variation = (variance ** 0.5) / avg_gap if avg_gap > 0 else float('inf')
+        avg_gap = gaps.mean()
+        coefficient_of_variation = gaps.std(ddof=1) / avg_gap if avg_gap > 0 else float('inf')
         
-        return coefficient_of_variation < 0.2
+        return bool(coefficient_of_variation < 0.2)
     
-    def _detect_burst_activity(self, timestamps: List[int]) -> Dict:
+    def _detect_burst_activity(self, sorted_times: np.ndarray) -> Dict:
         """Detect burst activity patterns"""
-        if len(timestamps) < 10:
+        if sorted_times.size < 10:
             return {'detected': False}
         
-        # Sort timestamps
-        sorted_times = sorted(timestamps)
-        
-        # Find clusters of activity (transactions within 1 hour)
-        clusters = []
-        current_cluster = [sorted_times[0]]
-        
-        for i in range(1, len(sorted_times)):
-            if sorted_times[i] - sorted_times[i-1] <= 3600:  # 1 hour
-                current_cluster.append(sorted_times[i])
-            else:
-                if len(current_cluster) >= 5:  # Burst = 5+ transactions in 1 hour
-                    clusters.append(current_cluster)
-                current_cluster = [sorted_times[i]]
+        # Split into clusters of activity wherever consecutive transactions are over 1 hour apart
+        breaks = np.flatnonzero(np.diff(sorted_times) > 3600) + 1
+        cluster_sizes = np.diff(np.concatenate(([0], breaks, [sorted_times.size])))
         
-        if len(current_cluster) >= 5:
-            clusters.append(current_cluster)
+        # Burst = 5+ transactions in 1 hour
+        bursts = cluster_sizes[cluster_sizes >= 5]
         
         return {
-            'detected': len(clusters) > 0,
-            'burst_count': len(clusters),
-            'largest_burst': max(len(cluster) for cluster in clusters) if clusters else 0,
-            'burst_frequency': len(clusters) / (len(sorted_times) / 100) if sorted_times else 0
+            'detected': bool(bursts.size),
+            'burst_count': int(bursts.size),
+            'largest_burst': int(bursts.max()) if bursts.size else 0,
+            'burst_frequency': bursts.size / (sorted_times.size / 100)
         }
     
-    def _analyze_time_patterns(self, timestamps: List[int]) -> Dict:
-        """Analyze time-of-day patterns"""
-        if not timestamps:
+    def _analyze_time_patterns(self, timestamps: np.ndarray) -> Dict:
+        """Analyze time-of-day patterns (UTC)"""
+        tx_count = timestamps.size
+        if not tx_count:
             return {}
         
-        hours = []
-        days_of_week = []
-        
-        for ts in timestamps:
-            try:
-                dt = datetime.fromtimestamp(ts)
-                hours.append(dt.hour)
-                days_of_week.append(dt.weekday())
-            except:
-                continue
-        
-        if not hours:
-            return {}
-        
-        # Analyze hour distribution
-        hour_counts = Counter(hours)
-        peak_hours = [hour for hour, count in hour_counts.most_common(3)]
-        
-        # Analyze day distribution
-        day_counts = Counter(days_of_week)
+        # Integer arithmetic on unix seconds; 1970-01-01 was a Thursday (weekday 3)
+        if tx_count < SMALL_TIME_SAMPLE:
+            hour_counts = [0] * 24
+            day_counts = [0] * 7
+            for timestamp in timestamps.tolist():
+                days, seconds = divmod(timestamp, 86400)
+                hour_counts[seconds // 3600] += 1
+                day_counts[(days + 3) % 7] += 1
+            
+            # Analyze hour distribution: the three busiest hours, busiest first
+            peak_hours = sorted((hour for hour in range(24) if hour_counts[hour]),
+                                key=hour_counts.__getitem__, reverse=True)[:3]
+        else:
+            days = timestamps // 86400
+            hour_bins = np.bincount((timestamps // 3600) % 24, minlength=24)
+            day_counts = np.bincount((days + 3) % 7, minlength=7).tolist()
+            
+            # Analyze hour distribution: the three busiest hours, busiest first
+            top_hours = np.argsort(-hour_bins, kind='stable')[:3]
+            peak_hours = [int(hour) for hour in top_hours if hour_bins[hour]]
+            hour_counts = hour_bins.tolist()
         
         return {
             'peak_hours': peak_hours,
-            'hour_distribution': dict(hour_counts),
-            'day_distribution': dict(day_counts),
-            'business_hours_ratio': sum(hour_counts[h] for h in range(9, 17)) / len(hours),
-            'weekend_ratio': sum(day_counts[d] for d in [5, 6]) / len(days_of_week) if days_of_week else 0
+            'hour_distribution': {hour: count for hour, count in enumerate(hour_counts) if count},
+            'day_distribution': {day: count for day, count in enumerate(day_counts) if count},
+            'business_hours_ratio': sum(hour_counts[9:17]) / tx_count,
+            'weekend_ratio': sum(day_counts[5:]) / tx_count
         }
     
     def _calculate_pattern_confidence(self, fee_analysis: Dict, timing_analysis: Dict, amount_analysis: Dict) -> float:
         """Calculate overall pattern confidence score"""
-        confidence = 0.0
-        
-        # Fee consistency contributes to confidence
-        if fee_analysis.get('fee_consistency', 0) > 0.8:
-            confidence += 0.3
-        
-        # Regular timing patterns
-        if timing_analysis.get('regular_intervals', False):
-            confidence += 0.3
-        
-        # Amount patterns
-        if amount_analysis.get('round_number_frequency', 0) > 0.5:
-            confidence += 0.2
-        
-        # Burst activity indicates automation
-        if timing_analysis.get('burst_activity', {}).get('detected', False):
-            confidence += 0.2
+        # Each signal adds its weight when present (bool * weight, no branches)
+        confidence = (
+            # Fee consistency contributes to confidence
+            0.3 * (fee_analysis.get('fee_consistency', 0) > 0.8) +
+            # Regular timing patterns
+            0.3 * bool(timing_analysis.get('regular_intervals', False)) +
+            # Amount patterns
+            0.2 * (amount_analysis.get('round_number_frequency', 0) > 0.5) +
+            # Burst activity indicates automation
+            0.2 * bool(timing_analysis.get('burst_activity', {}).get('detected', False))
+        )
         
         return min(confidence, 1.0)
     
     def _classify_activity_level(self, transactions: List[Dict], patterns: Dict) -> str:
         """Classify address activity level"""
-        tx_count = len(transactions)
+        return _ACTIVITY_LABELS[bisect.bisect_right(_ACTIVITY_BOUNDS, len(transactions))]
+    
+    def classify_addresses(self, addresses: List[str]) -> pd.DataFrame:
+        """Tag addresses with their known service info in one join; unknown addresses get NaN"""
+        services = _SERVICE_DF
+        if self._service_overrides:
+            overrides = pd.DataFrame.from_dict(self._service_overrides, orient='index')
+            services = pd.concat([overrides, services[~services.index.isin(overrides.index)]])
         
-        if tx_count == 0:
-            return 'inactive'
-        elif tx_count < 10:
-            return 'low'
-        elif tx_count < 100:
-            return 'medium'
-        elif tx_count < 1000:
-            return 'high'
-        else:
-            return 'very_high'
+        return pd.DataFrame({'address': addresses}).merge(
+            services, left_on='address', right_index=True, how='left'
+        )
     
     def _classify_service_type(self, address: str, transactions: List[Dict], patterns: Dict) -> str:
         """Classify the type of service this address represents"""
         # Check known services first
-        if address in self.service_database:
-            return self.service_database[address]['service']
+        service_info = self.service_database.get(address)
+        if service_info is not None:
+            return service_info['service']
         
         # Analyze patterns to classify
         tx_count = len(transactions)
+        timing_analysis = patterns.get('timing_analysis', {})
         
         # High volume + regular patterns = likely exchange
-        if (tx_count > 1000 and 
-            patterns.get('timing_analysis', {}).get('regular_intervals', False)):
+        if tx_count > 1000 and timing_analysis.get('regular_intervals', False):
             return 'exchange_suspected'
         
         # Burst activity + round amounts = likely automated service
-        if (patterns.get('timing_analysis', {}).get('burst_activity', {}).get('detected', False) and
+        if (timing_analysis.get('burst_activity', {}).get('detected', False) and
             patterns.get('amount_analysis', {}).get('round_number_frequency', 0) > 0.7):
             return 'automated_service'
         
@@ -859,46 +1036,30 @@ class EnhancedWELSHFounderHunter:
         return {
             'risk_score': min(risk_score, 1.0),
             'risk_factors': risk_factors,
-            'risk_level': 'high' if risk_score > 0.7 else 'medium' if risk_score > 0.3 else 'low'
+            'risk_level': _RISK_LABELS[bisect.bisect_left(_RISK_BOUNDS, risk_score)]
         }
     
-    def _analyze_temporal_patterns(self, transactions: List[Dict]) -> Dict:
+    def _analyze_temporal_patterns(self, tx_arrays: TransactionArrays) -> Dict:
         """Analyze temporal patterns in transactions"""
-        if not transactions:
-            return {}
-        
-        # Extract timestamps
-        timestamps = [tx.get('burn_block_time') for tx in transactions if tx.get('burn_block_time')]
-        
-        if len(timestamps) < 2:
+        if tx_arrays.sorted_times.size < 2:
             return {}
         
-        # Sort timestamps
-        sorted_times = sorted(timestamps)
+        sorted_times = tx_arrays.sorted_times
         
         # Calculate activity periods
-        first_tx = datetime.fromtimestamp(sorted_times[0])
-        last_tx = datetime.fromtimestamp(sorted_times[-1])
-        total_period = (last_tx - first_tx).total_seconds()
-        
-        # Find active periods (periods with transactions)
-        active_periods = []
-        current_period_start = sorted_times[0]
-        
-        for i in range(1, len(sorted_times)):
-            gap = sorted_times[i] - sorted_times[i-1]
-            if gap > 86400:  # 24 hours gap = new period
-                active_periods.append((current_period_start, sorted_times[i-1]))
-                current_period_start = sorted_times[i]
+        total_period = int(sorted_times[-1] - sorted_times[0])
         
-        active_periods.append((current_period_start, sorted_times[-1]))
+        # Active periods (periods with transactions) are separated by gaps of over 24 hours,
+        # so the inactive stretches are exactly those gaps
+        gaps = np.diff(sorted_times)
+        inactive_gaps = gaps[gaps > 86400]
+        active_periods = inactive_gaps.size + 1
         
         return {
             'total_period_days': total_period / 86400,
-            'active_periods': len(active_periods),
-            'longest_inactive_period': max([active_periods[i][0] - active_periods[i-1][1] 
-                                          for i in range(1, len(active_periods))], default=0) / 86400,
-            'activity_consistency': len(active_periods) / (total_period / 86400) if total_period > 0 else 0
+            'active_periods': active_periods,
+            'longest_inactive_period': int(inactive_gaps.max(initial=0)) / 86400,
+            'activity_consistency': active_periods / (total_period / 86400) if total_period > 0 else 0
         }
     
     def _analyze_deployment_context(self, tx_details: Dict, tx_events: Dict, 
@@ -914,12 +1075,11 @@ class EnhancedWELSHFounderHunter:
                 'deployer_profile': 'normal'
             }
             
-            # Analyze deployment timing
+            # Analyze deployment timing (UTC hour, like the address time patterns)
             deploy_time = tx_details.get('burn_block_time')
             if deploy_time:
-                dt = datetime.fromtimestamp(deploy_time)
-                hour = dt.hour
-                
+                hour = (int(deploy_time) // 3600) % 24
+
                 # Suspicious timing
                 if hour < 6 or hour > 22:
                     analysis['risk_factors'].append('unusual_deployment_time')
@@ -949,7 +1109,7 @@ class EnhancedWELSHFounderHunter:
             return analysis
             
         except Exception as e:
-            print(f"⚠️ Deployment context analysis failed: {e}")
+            logger.warning(f"⚠️ Deployment context analysis failed: {e}")
             return {'risk_score': 0.0, 'error': str(e)}
     
     def _count_concurrent_deployments(self, block_transactions: Dict) -> int:
@@ -957,12 +1117,7 @@ class EnhancedWELSHFounderHunter:
         if not block_transactions or 'results' not in block_transactions:
             return 0
         
-        deployment_count = 0
-        for tx in block_transactions['results']:
-            if tx.get('tx_type') == 'smart_contract':
-                deployment_count += 1
-        
-        return deployment_count
+        return sum(tx.get('tx_type') == 'smart_contract' for tx in block_transactions['results'])
     
     def _update_mission_state(self, new_phase: int, objective: str):
         """Update mission state with comprehensive tracking"""
@@ -970,34 +1125,41 @@ class EnhancedWELSHFounderHunter:
         self.mission_state['phase'] = new_phase
         self.mission_state['current_objective'] = objective
         
-        print(f"🔄 Mission State Updated: Phase {new_phase} - {objective}")
-        print(f"   📊 API calls: {self.mission_state['api_calls_made']}")
-        print(f"   🔍 Addresses analyzed: {self.mission_state['addresses_analyzed']}")
-        print(f"   📈 Transactions processed: {self.mission_state['total_transactions_processed']}")
+        logger.info(f"🔄 Mission State Updated: Phase {new_phase} - {objective}")
+        logger.info(f"   📊 API calls: {self.mission_state['api_calls_made']}")
+        logger.info(f"   🔍 Addresses analyzed: {self.mission_state['addresses_analyzed']}")
+        logger.info(f"   📈 Transactions processed: {self.mission_state['total_transactions_processed']}")
     
     def run_comprehensive_investigation(self, welsh_contract: str, arkadiko_wallets: List[str], 
                                        philip_wallets: List[str] = None) -> Dict:
         """Run comprehensive investigation utilizing all Hiro API capabilities"""
+        return asyncio.run(self.run_comprehensive_investigation_async(
+            welsh_contract, arkadiko_wallets, philip_wallets
+        ))
+    
+    async def run_comprehensive_investigation_async(self, welsh_contract: str, arkadiko_wallets: List[str], 
+                                                    philip_wallets: List[str] = None) -> Dict:
+        """Async variant of run_comprehensive_investigation for callers already in an event loop"""
         try:
-            print("🚀 Starting Comprehensive WELSH-Founder Hunter Investigation")
-            print("=" * 70)
+            logger.info("🚀 Starting Comprehensive WELSH-Founder Hunter Investigation")
+            logger.info("=" * 70)
             
             # Phase 0: Comprehensive Bootstrap
-            if not self.comprehensive_bootstrap(welsh_contract, arkadiko_wallets, philip_wallets):
+            if not await self.comprehensive_bootstrap(welsh_contract, arkadiko_wallets, philip_wallets):
                 return {'success': False, 'error': 'Comprehensive bootstrap failed'}
             
             # Phase 1: Comprehensive Deployer Discovery
-            deployer_info = self.comprehensive_deployer_discovery()
+            deployer_info = await self.comprehensive_deployer_discovery()
             if not deployer_info:
                 return {'success': False, 'error': 'Comprehensive deployer discovery failed'}
             
             deployer_address, deploy_tx, deployer_data = deployer_info
             
-            print("\n" + "=" * 70)
-            print("🎉 Comprehensive Investigation Complete!")
-            print(f"📊 Total API calls made: {self.mission_state['api_calls_made']}")
-            print(f"🔍 Addresses analyzed: {self.mission_state['addresses_analyzed']}")
-            print(f"📈 Transactions processed: {self.mission_state['total_transactions_processed']}")
+            logger.info("\n" + "=" * 70)
+            logger.info("🎉 Comprehensive Investigation Complete!")
+            logger.info(f"📊 Total API calls made: {self.mission_state['api_calls_made']}")
+            logger.info(f"🔍 Addresses analyzed: {self.mission_state['addresses_analyzed']}")
+            logger.info(f"📈 Transactions processed: {self.mission_state['total_transactions_processed']}")
             
             return {
                 'success': True,
@@ -1011,11 +1173,16 @@ class EnhancedWELSHFounderHunter:
             }
             
         except Exception as e:
-            print(f"❌ Comprehensive investigation failed: {e}")
+            logger.error(f"❌ Comprehensive investigation failed: {e}")
             return {'success': False, 'error': str(e)}
+        finally:
+            await self.api.close()
+            flush_logging()
 
 # Demo the comprehensive enhanced agent
 if __name__ == "__main__":
+    configure_logging()
+    
     print("🔍 Enhanced WELSH-Founder Hunter - Comprehensive Hiro API Utilization")
     print("=" * 70)
     
@@ -1035,11 +1202,12 @@ if __name__ == "__main__":
     print("🚀 Initializing comprehensive hunter...")
     
     hunter = EnhancedWELSHFounderHunter(config)
+    flush_logging()
     
     print(f"\n🎯 Ready for comprehensive investigation!")
     print(f"📊 Utilizing {len(hunter.api.endpoints)} API endpoints")
     print(f"🔍 Service database: {len(hunter.service_database)} known addresses")
-    print(f"⚡ Rate limit: {hunter.api.rate_limit['requests_per_minute']} requests/minute")
+    print(f"⚡ Rate limit: {hunter.api.requests_per_minute} requests/minute")
     
     # Example usage
     print(f"\n📋 Example usage:")
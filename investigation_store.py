@@ -0,0 +1,110 @@
+# WELSH-Founder Hunter - Investigation State Store
+# Redis-backed investigation state shared across API workers
+
+import os
+from datetime import datetime
+from typing import AsyncIterator, Dict, Optional
+
+import orjson
+import redis.asyncio as redis
+
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+INVESTIGATION_TTL = int(os.getenv('INVESTIGATION_TTL', 86400))  # Seconds an investigation is kept
+FINAL_STATUSES = ('completed', 'failed')
+
+# Fields served by GET /investigate/{id}; completed results are stored in exactly
+# this shape so the API can return the stored JSON without re-validating it
+RESULT_FIELDS = (
+    'success', 'deployer_address', 'cluster_size', 'evidence_count',
+    'confidence_score', 'conclusion', 'report', 'error'
+)
+
+
+def create_redis_client() -> redis.Redis:
+    """Create the Redis client used for investigation state"""
+    return redis.from_url(REDIS_URL, decode_responses=True)
+
+
+def investigation_key(investigation_id: str) -> str:
+    """Redis key of the hash holding one investigation"""
+    return f"inv:{investigation_id}"
+
+
+async def save_investigation(r: redis.Redis, investigation_id: str, status: str,
+                             result: Optional[Dict] = None, created: bool = False):
+    """Write investigation status (and result, if any), refresh its TTL and
+    publish the status to subscribers of the investigation channel"""
+    key = investigation_key(investigation_id)
+    mapping = {'status': status}
+
+    if result is not None:
+        mapping['result'] = orjson.dumps(result, default=str)
+    if created:
+        mapping['created_at'] = datetime.now().isoformat()
+
+    # MULTI/EXEC so concurrent writers never observe a hash without its TTL
+    async with r.pipeline(transaction=True) as pipe:
+        pipe.hset(key, mapping=mapping)
+        pipe.expire(key, INVESTIGATION_TTL)
+        pipe.publish(key, status)
+        await pipe.execute()
+
+
+async def load_investigation(r: redis.Redis, investigation_id: str,
+                             decode_result: bool = True) -> Optional[Dict]:
+    """Read an investigation hash, returning None if it does not exist
+
+    With decode_result=False the result is left as its stored JSON string.
+    """
+    investigation = await r.hgetall(investigation_key(investigation_id))
+
+    if not investigation:
+        return None
+
+    if 'result' not in investigation:
+        investigation['result'] = None
+    elif decode_result:
+        investigation['result'] = orjson.loads(investigation['result'])
+
+    return investigation
+
+
+async def load_investigation_status(r: redis.Redis, investigation_id: str) -> Optional[str]:
+    """Read only the status field, returning None if the investigation does not exist"""
+    return await r.hget(investigation_key(investigation_id), 'status')
+
+
+async def delete_investigation(r: redis.Redis, investigation_id: str) -> bool:
+    """Drop an investigation before its TTL expires, returning whether it existed"""
+    return await r.delete(investigation_key(investigation_id)) > 0
+
+
+async def watch_investigation(r: redis.Redis, investigation_id: str,
+                              poll_timeout: float = 30.0) -> AsyncIterator[str]:
+    """Yield the current status, then each transition until a final status"""
+    key = investigation_key(investigation_id)
+
+    async with r.pubsub() as pubsub:
+        await pubsub.subscribe(key)
+
+        # Read after subscribing so a transition in between is not missed
+        status = await load_investigation_status(r, investigation_id)
+        if status is None:
+            return
+        yield status
+
+        while status not in FINAL_STATUSES:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=poll_timeout)
+
+            if message is None:
+                # Quiet channel: re-check in case the investigation expired or was deleted
+                current = await load_investigation_status(r, investigation_id)
+                if current is None:
+                    return
+                if current == status:
+                    continue
+            else:
+                current = message['data']
+
+            status = current
+            yield status
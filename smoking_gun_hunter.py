@@ -1,11 +1,17 @@
 # WELSH-Founder Hunter - Smoking Gun Investigation Protocol
 # Definitive blockchain forensics to find SMOKING GUN proof
 
-import requests
+import asyncio
+import httpx
 import json
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
+RETRY_TOTAL = 3  # Retries per request after the first attempt
+RETRY_BACKOFF = 0.3  # Seconds before the first retry, doubled on each further retry
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+POOL_MAXSIZE = 32  # Connections the shared client opens at most
+
 class SmokingGunHunter:
     """
     Smoking Gun Investigation Protocol for WELSH-Founder Hunter
@@ -15,10 +21,13 @@ class SmokingGunHunter:
     def __init__(self, hiro_api_key: str = None):
         self.hiro_api_key = hiro_api_key
         self.base_url = "https://api.hiro.so"
-        self.session = requests.Session()
+        self.headers = {'X-API-Key': hiro_api_key} if hiro_api_key else {}
+        
+        # Created on first use inside the running event loop (see _get_client)
+        self._client = None
         
-        if hiro_api_key:
-            self.session.headers.update({'X-API-Key': hiro_api_key})
+        # (address, limit) -> in-flight or finished history request, shared between checks
+        self._tx_cache: Dict[Tuple[str, int], asyncio.Future] = {}
         
         # Seed data from investigation
         self.seed_data = {
@@ -31,14 +40,74 @@ class SmokingGunHunter:
             ]
         }
         
+        # Membership set for the Arkadiko checks, built once
+        self._arkadiko_addresses = frozenset(self.seed_data['arkadiko_addresses'])
+        
         self.smoking_guns = []
         self.evidence_score = 0
     
-    def get_transaction_details(self, tx_id: str) -> Optional[Dict]:
-        """Get detailed transaction information"""
+    def _record_smoking_gun(self, smoking_gun: Dict, score: int):
+        """Record a smoking gun found by a check"""
+        self.smoking_guns.append(smoking_gun)
+        self.evidence_score += score
+    
+    def _report_check(self, found: Optional[Tuple[Dict, int]], log: List[str]) -> bool:
+        """Print a check's report and record its smoking gun, if it found one"""
+        for line in log:
+            print(line)
+        if found:
+            self._record_smoking_gun(*found)
+        return found is not None
+    
+    def _run(self, coro):
+        """Drive a coroutine from synchronous code, closing the client it opened on the way out"""
+        async def run():
+            try:
+                return await coro
+            finally:
+                if self._client is not None:
+                    await self._client.aclose()
+        return asyncio.run(run())
+    
+    def _run_check(self, check) -> bool:
+        """Run one async check synchronously, printing and recording as it always did"""
+        log = []
+        return self._report_check(self._run(check(log)), log)
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Lazily open the HTTP/2 client; all checks multiplex over its connection"""
+        if self._client is None or self._client.is_closed:
+            # The transport owns the pool, so HTTP/2 and the pool limits are set on it;
+            # connection failures are retried by the transport, bad statuses in _get
+            transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=POOL_MAXSIZE, max_keepalive_connections=8),
+                retries=RETRY_TOTAL
+            )
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                transport=transport,
+                timeout=30
+            )
+        return self._client
+    
+    async def _get(self, path: str, params: Dict = None) -> httpx.Response:
+        """GET a Hiro API path, retrying rate-limited and server error responses"""
+        client = self._get_client()
+        
+        for attempt in range(RETRY_TOTAL):
+            response = await client.get(path, params=params)
+            if response.status_code not in RETRY_STATUSES:
+                return response
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+        
+        return await client.get(path, params=params)
+    
+    async def get_transaction_details_async(self, tx_id: str) -> Optional[Dict]:
+        """Get detailed transaction information (async variant of get_transaction_details)"""
         try:
-            url = f"{self.base_url}/extended/v1/tx/{tx_id}"
-            response = self.session.get(url, timeout=30)
+            response = await self._get(f"/extended/v1/tx/{tx_id}")
             
             if response.status_code == 200:
                 return response.json()
@@ -50,12 +119,18 @@ class SmokingGunHunter:
             print(f"⚠️ Error getting transaction {tx_id}: {e}")
             return None
     
-    def get_address_transactions(self, address: str, limit: int = 50) -> Optional[Dict]:
-        """Get transaction history for an address"""
+    async def get_address_transactions_async(self, address: str, limit: int = 50) -> Optional[Dict]:
+        """Get transaction history for an address; concurrent callers share one request"""
+        key = (address, limit)
+        if key not in self._tx_cache:
+            self._tx_cache[key] = asyncio.ensure_future(self._fetch_address_transactions(address, limit))
+        return await self._tx_cache[key]
+    
+    async def _fetch_address_transactions(self, address: str, limit: int) -> Optional[Dict]:
+        """Fetch transaction history for an address"""
         try:
-            url = f"{self.base_url}/extended/v1/address/{address}/transactions"
             params = {'limit': limit}
-            response = self.session.get(url, params=params, timeout=30)
+            response = await self._get(f"/extended/v1/address/{address}/transactions", params)
             
             if response.status_code == 200:
                 return response.json()
@@ -67,25 +142,25 @@ class SmokingGunHunter:
             print(f"⚠️ Error getting transactions for {address}: {e}")
             return None
     
-    def smoking_gun_check_1_gift_transaction_sender(self) -> bool:
+    async def smoking_gun_check_1_gift_transaction_sender_async(self, log: List[str]) -> Optional[Tuple[Dict, int]]:
         """
         SMOKING GUN CHECK 1: Gift Transaction Sender Analysis
         If sender of 1B WELSH transfer = deployer, then 'anonymous founders' is FALSE
         """
-        print("\n🔍 SMOKING GUN CHECK 1: Gift Transaction Sender Analysis")
-        print(f"Target: {self.seed_data['gift_tx']}")
+        log.append("\n🔍 SMOKING GUN CHECK 1: Gift Transaction Sender Analysis")
+        log.append(f"Target: {self.seed_data['gift_tx']}")
         
-        gift_tx_data = self.get_transaction_details(self.seed_data['gift_tx'])
+        gift_tx_data = await self.get_transaction_details_async(self.seed_data['gift_tx'])
         
         if not gift_tx_data:
-            print("❌ Could not retrieve gift transaction data")
-            return False
+            log.append("❌ Could not retrieve gift transaction data")
+            return None
         
         sender = gift_tx_data.get('sender_address')
         deployer = self.seed_data['welsh_deployer']
         
-        print(f"Gift Transaction Sender: {sender}")
-        print(f"WELSH Deployer Address: {deployer}")
+        log.append(f"Gift Transaction Sender: {sender}")
+        log.append(f"WELSH Deployer Address: {deployer}")
         
         if sender == deployer:
             smoking_gun = {
@@ -96,35 +171,32 @@ class SmokingGunHunter:
                 'confidence': 99,
                 'legal_impact': 'FRAUD_PROVEN'
             }
-            self.smoking_guns.append(smoking_gun)
-            self.evidence_score += 50
-            
-            print("🚨 SMOKING GUN FOUND!")
-            print(f"✅ {smoking_gun['conclusion']}")
-            return True
+            log.append("🚨 SMOKING GUN FOUND!")
+            log.append(f"✅ {smoking_gun['conclusion']}")
+            return smoking_gun, 50
         else:
-            print(f"❌ No direct match found")
-            return False
+            log.append(f"❌ No direct match found")
+            return None
     
-    def smoking_gun_check_2_lp_transaction_sender(self) -> bool:
+    async def smoking_gun_check_2_lp_transaction_sender_async(self, log: List[str]) -> Optional[Tuple[Dict, int]]:
         """
         SMOKING GUN CHECK 2: LP Transaction Sender Analysis
         If LP adder = deployer, same person created token AND provided liquidity
         """
-        print("\n🔍 SMOKING GUN CHECK 2: LP Transaction Sender Analysis")
-        print(f"Target: {self.seed_data['lp_seed_tx']}")
+        log.append("\n🔍 SMOKING GUN CHECK 2: LP Transaction Sender Analysis")
+        log.append(f"Target: {self.seed_data['lp_seed_tx']}")
         
-        lp_tx_data = self.get_transaction_details(self.seed_data['lp_seed_tx'])
+        lp_tx_data = await self.get_transaction_details_async(self.seed_data['lp_seed_tx'])
         
         if not lp_tx_data:
-            print("❌ Could not retrieve LP transaction data")
-            return False
+            log.append("❌ Could not retrieve LP transaction data")
+            return None
         
         sender = lp_tx_data.get('sender_address')
         deployer = self.seed_data['welsh_deployer']
         
-        print(f"LP Transaction Sender: {sender}")
-        print(f"WELSH Deployer Address: {deployer}")
+        log.append(f"LP Transaction Sender: {sender}")
+        log.append(f"WELSH Deployer Address: {deployer}")
         
         if sender == deployer:
             smoking_gun = {
@@ -135,38 +207,34 @@ class SmokingGunHunter:
                 'confidence': 95,
                 'legal_impact': 'COORDINATION_PROVEN'
             }
-            self.smoking_guns.append(smoking_gun)
-            self.evidence_score += 30
-            
-            print("🚨 SMOKING GUN FOUND!")
-            print(f"✅ {smoking_gun['conclusion']}")
-            return True
+            log.append("🚨 SMOKING GUN FOUND!")
+            log.append(f"✅ {smoking_gun['conclusion']}")
+            return smoking_gun, 30
         else:
-            print(f"❌ No direct match found")
-            return False
+            log.append(f"❌ No direct match found")
+            return None
     
-    def smoking_gun_check_3_funding_source_trace(self) -> bool:
+    async def smoking_gun_check_3_funding_source_trace_async(self, log: List[str]) -> Optional[Tuple[Dict, int]]:
         """
         SMOKING GUN CHECK 3: Deployer Funding Source Trace
         If deployer funded by known Philip/Arkadiko addresses
         """
-        print("\n🔍 SMOKING GUN CHECK 3: Deployer Funding Source Trace")
-        print(f"Target: {self.seed_data['welsh_deployer']}")
+        log.append("\n🔍 SMOKING GUN CHECK 3: Deployer Funding Source Trace")
+        log.append(f"Target: {self.seed_data['welsh_deployer']}")
         
-        deployer_txs = self.get_address_transactions(self.seed_data['welsh_deployer'])
+        deployer_txs = await self.get_address_transactions_async(self.seed_data['welsh_deployer'])
         
         if not deployer_txs:
-            print("❌ Could not retrieve deployer transaction history")
-            return False
+            log.append("❌ Could not retrieve deployer transaction history")
+            return None
         
         transactions = deployer_txs.get('results', [])
-        arkadiko_addresses = set(self.seed_data['arkadiko_addresses'])
         
         funding_sources = []
         for tx in transactions:
             if tx.get('stx_received', 0) > 0:  # Incoming STX
                 sender = tx.get('sender_address')
-                if sender in arkadiko_addresses:
+                if sender in self._arkadiko_addresses:
                     funding_sources.append({
                         'tx_id': tx.get('tx_id'),
                         'sender': sender,
@@ -184,33 +252,29 @@ class SmokingGunHunter:
                 'legal_impact': 'CONTROL_PROVEN',
                 'funding_sources': funding_sources
             }
-            self.smoking_guns.append(smoking_gun)
-            self.evidence_score += 25
-            
-            print("🚨 SMOKING GUN FOUND!")
-            print(f"✅ {smoking_gun['conclusion']}")
-            print(f"   Found {len(funding_sources)} funding transactions")
-            return True
+            log.append("🚨 SMOKING GUN FOUND!")
+            log.append(f"✅ {smoking_gun['conclusion']}")
+            log.append(f"   Found {len(funding_sources)} funding transactions")
+            return smoking_gun, 25
         else:
-            print(f"❌ No funding from known Arkadiko addresses found")
-            return False
+            log.append(f"❌ No funding from known Arkadiko addresses found")
+            return None
     
-    def smoking_gun_check_4_arkadiko_interactions(self) -> bool:
+    async def smoking_gun_check_4_arkadiko_interactions_async(self, log: List[str]) -> Optional[Tuple[Dict, int]]:
         """
         SMOKING GUN CHECK 4: Arkadiko Contract Interactions
         Direct contract calls between deployer and Arkadiko
         """
-        print("\n🔍 SMOKING GUN CHECK 4: Arkadiko Contract Interactions")
-        print(f"Target: {self.seed_data['welsh_deployer']}")
+        log.append("\n🔍 SMOKING GUN CHECK 4: Arkadiko Contract Interactions")
+        log.append(f"Target: {self.seed_data['welsh_deployer']}")
         
-        deployer_txs = self.get_address_transactions(self.seed_data['welsh_deployer'])
+        deployer_txs = await self.get_address_transactions_async(self.seed_data['welsh_deployer'])
         
         if not deployer_txs:
-            print("❌ Could not retrieve deployer transaction history")
-            return False
+            log.append("❌ Could not retrieve deployer transaction history")
+            return None
         
         transactions = deployer_txs.get('results', [])
-        arkadiko_addresses = set(self.seed_data['arkadiko_addresses'])
         
         interactions = []
         for tx in transactions:
@@ -218,15 +282,14 @@ class SmokingGunHunter:
                 contract_call = tx.get('contract_call', {})
                 contract_id = contract_call.get('contract_id', '')
                 
-                # Check if contract call is to Arkadiko
-                for arkadiko_addr in arkadiko_addresses:
-                    if contract_id.startswith(arkadiko_addr):
-                        interactions.append({
-                            'tx_id': tx.get('tx_id'),
-                            'contract_id': contract_id,
-                            'function_name': contract_call.get('function_name'),
-                            'timestamp': tx.get('burn_block_time_iso')
-                        })
+                # Check if contract call is to Arkadiko (contract ids are ADDRESS.contract-name)
+                if contract_id.split('.', 1)[0] in self._arkadiko_addresses:
+                    interactions.append({
+                        'tx_id': tx.get('tx_id'),
+                        'contract_id': contract_id,
+                        'function_name': contract_call.get('function_name'),
+                        'timestamp': tx.get('burn_block_time_iso')
+                    })
         
         if interactions:
             smoking_gun = {
@@ -238,22 +301,51 @@ class SmokingGunHunter:
                 'legal_impact': 'COORDINATION_PROVEN',
                 'interactions': interactions
             }
-            self.smoking_guns.append(smoking_gun)
-            self.evidence_score += 20
-            
-            print("🚨 SMOKING GUN FOUND!")
-            print(f"✅ {smoking_gun['conclusion']}")
-            print(f"   Found {len(interactions)} contract interactions")
-            return True
+            log.append("🚨 SMOKING GUN FOUND!")
+            log.append(f"✅ {smoking_gun['conclusion']}")
+            log.append(f"   Found {len(interactions)} contract interactions")
+            return smoking_gun, 20
         else:
-            print(f"❌ No direct Arkadiko contract interactions found")
-            return False
+            log.append(f"❌ No direct Arkadiko contract interactions found")
+            return None
+    
+    # Synchronous entry points, kept for callers outside an event loop
+    
+    def get_transaction_details(self, tx_id: str) -> Optional[Dict]:
+        """Get detailed transaction information"""
+        return self._run(self.get_transaction_details_async(tx_id))
+    
+    def get_address_transactions(self, address: str, limit: int = 50) -> Optional[Dict]:
+        """Get transaction history for an address"""
+        return self._run(self.get_address_transactions_async(address, limit))
+    
+    def smoking_gun_check_1_gift_transaction_sender(self) -> bool:
+        """SMOKING GUN CHECK 1, run synchronously"""
+        return self._run_check(self.smoking_gun_check_1_gift_transaction_sender_async)
+    
+    def smoking_gun_check_2_lp_transaction_sender(self) -> bool:
+        """SMOKING GUN CHECK 2, run synchronously"""
+        return self._run_check(self.smoking_gun_check_2_lp_transaction_sender_async)
+    
+    def smoking_gun_check_3_funding_source_trace(self) -> bool:
+        """SMOKING GUN CHECK 3, run synchronously"""
+        return self._run_check(self.smoking_gun_check_3_funding_source_trace_async)
+    
+    def smoking_gun_check_4_arkadiko_interactions(self) -> bool:
+        """SMOKING GUN CHECK 4, run synchronously"""
+        return self._run_check(self.smoking_gun_check_4_arkadiko_interactions_async)
     
     def run_smoking_gun_investigation(self) -> Dict:
         """
         Run complete smoking gun investigation
         Returns definitive proof or lack thereof
         """
+        return asyncio.run(self.run_smoking_gun_investigation_async())
+    
+    async def run_smoking_gun_investigation_async(self) -> Dict:
+        """Async variant of run_smoking_gun_investigation for callers already in an event loop"""
+        self._tx_cache.clear()  # Histories are only shared within one investigation
+        
         print("🚨 WELSH-FOUNDER HUNTER - SMOKING GUN INVESTIGATION")
         print("=" * 70)
         print("🎯 Mission: Find DEFINITIVE on-chain proof linking WELSH to Philip")
@@ -261,19 +353,29 @@ class SmokingGunHunter:
         
         # Run all smoking gun checks
         checks = [
-            self.smoking_gun_check_1_gift_transaction_sender,
-            self.smoking_gun_check_2_lp_transaction_sender,
-            self.smoking_gun_check_3_funding_source_trace,
-            self.smoking_gun_check_4_arkadiko_interactions
+            self.smoking_gun_check_1_gift_transaction_sender_async,
+            self.smoking_gun_check_2_lp_transaction_sender_async,
+            self.smoking_gun_check_3_funding_source_trace_async,
+            self.smoking_gun_check_4_arkadiko_interactions_async
         ]
         
-        smoking_guns_found = 0
-        for check in checks:
+        async def run_check(check) -> Tuple[Optional[Tuple[Dict, int]], List[str]]:
+            log = []
             try:
-                if check():
-                    smoking_guns_found += 1
+                return await check(log), log
             except Exception as e:
-                print(f"⚠️ Check failed: {e}")
+                log.append(f"⚠️ Check failed: {e}")
+                return None, log
+        
+        # The checks are independent API lookups, so their requests share one HTTP/2 connection
+        try:
+            outcomes = await asyncio.gather(*(run_check(check) for check in checks))
+        finally:
+            if self._client is not None:
+                await self._client.aclose()
+        
+        # Report and record in check order, whatever order the checks finished in
+        smoking_guns_found = sum(self._report_check(found, log) for found, log in outcomes)
         
         # Calculate final assessment
         if self.evidence_score >= 50:
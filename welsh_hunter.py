@@ -1,19 +1,56 @@
 # Enhanced WELSH-Founder Hunter AI Agent - Comprehensive Hiro API Utilization
 # Production-ready blockchain forensics agent utilizing every possible Hiro API option
 
-import json
-import requests
-import networkx as nx
+import asyncio
+import os
+import random
+import sqlite3
+import sys
+import time
+import httpx
+import orjson
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 import hashlib
 import re
 from typing import Dict, List, Set, Tuple, Optional
 from dataclasses import dataclass, asdict
+from array import array
 from collections import defaultdict
-import time
+from cachetools import LRUCache
+
+DEFAULT_BATCH_SIZE = 20  # Hiro requests in flight per investigation unless config sets batch_size
+TX_FETCH_LIMIT = 100  # Largest history any phase reads; fetched once per address and sliced
+TX_PAGE_LIMIT = 50  # Most transactions the Hiro address endpoint returns per page
+EVENT_PAGE_LIMIT = 100  # Contract events requested per page
+MAX_CONTRACT_EVENTS = 1000  # Events scanned per Arkadiko contract, to bound API calls
+REQUEST_RETRIES = 5  # Attempts per request on connection errors, 429s and transient 5xx responses
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+TX_CACHE_TTL = 3600  # Seconds a cached address history is served before it is refetched
+DEFAULT_TX_CACHE_PATH = os.path.join(  # Per-user, so the cache does not follow the working directory
+    os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'welsh-hunter', 'tx_cache.sqlite3'
+)
+HEURISTICS_CACHE_SIZE = 4096  # Memoized heuristic results kept per hunter
+MAX_RATE_LIMIT_PAUSE = 60  # Longest pause, in seconds, honoured from rate limit headers
+RATE_LIMIT_WINDOWS = {'second': 1, 'minute': 60, 'hour': 3600}  # x-ratelimit-remaining-<window>
+
+# Scoring weights as per spec; evidence of any other type weighs OTHER_EVIDENCE_WEIGHT
+EVIDENCE_WEIGHTS = {
+    'cex_funding': 40,
+    'arkadiko_interaction': 25,
+    'fee_pattern': 15,
+    'stylometry': 10,
+    'timing_correlation': 10
+}
+OTHER_EVIDENCE_WEIGHT = 5
+
+# Weights indexed by evidence type; the final slot is shared by all other types
+_EVIDENCE_TYPE_INDEX = {evidence_type: i for i, evidence_type in enumerate(EVIDENCE_WEIGHTS)}
+_EVIDENCE_WEIGHT_VECTOR = np.array([*EVIDENCE_WEIGHTS.values(), OTHER_EVIDENCE_WEIGHT], dtype=np.float64)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WalletCluster:
     """Represents a cluster of related wallets"""
     primary_address: str
@@ -23,7 +60,7 @@ class WalletCluster:
     first_seen: datetime
     last_seen: datetime
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Evidence:
     """Evidence item for founder correlation"""
     evidence_type: str
@@ -32,28 +69,207 @@ class Evidence:
     timestamp: datetime
     source_data: Dict
 
+class DSU:
+    """Union-find over addresses; each component is one candidate wallet cluster"""
+    
+    def __init__(self):
+        self.parent: Dict[str, str] = {}
+    
+    def find(self, address: str) -> str:
+        """Root of an address's component, halving the path on the way up"""
+        parent = self.parent
+        parent.setdefault(address, address)
+        while parent[address] != address:
+            parent[address] = parent[parent[address]]
+            address = parent[address]
+        return address
+    
+    def union(self, a: str, b: str) -> bool:
+        """Merge the components of two addresses, returning False if already joined"""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        self.parent[root_b] = root_a
+        return True
+    
+    def component(self, address: str) -> Set[str]:
+        """All addresses in the same component as `address`"""
+        root = self.find(address)
+        return {member for member in self.parent if self.find(member) == root}
+
+class RateLimiter:
+    """Bounds concurrent requests and holds new ones while the API asks callers to back off"""
+    
+    def __init__(self, max_concurrent: int):
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._open = asyncio.Event()
+        self._open.set()
+        self._resume_at = 0.0
+    
+    async def __aenter__(self):
+        await self._open.wait()
+        await self._slots.acquire()
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        self._slots.release()
+    
+    def update(self, headers: httpx.Headers) -> float:
+        """Pause for Retry-After, or until the window resets once no requests remain;
+        returns the pause in seconds (0 if none)"""
+        delay = headers.get('retry-after') or self._exhausted_window_reset(headers)
+        
+        try:
+            delay = float(delay)
+        except (TypeError, ValueError):
+            return 0.0  # No back-off requested (or an HTTP-date Retry-After, left to the 429 backoff)
+        
+        # Some gateways send the reset as an epoch timestamp rather than a delay
+        if delay > 1e9:
+            delay -= time.time()
+        delay = min(delay, MAX_RATE_LIMIT_PAUSE)
+        
+        if delay > 0:
+            loop = asyncio.get_running_loop()
+            self._resume_at = max(self._resume_at, loop.time() + delay)
+            self._open.clear()
+            loop.call_at(self._resume_at, self._resume)
+            return delay
+        return 0.0
+    
+    @staticmethod
+    def _exhausted_window_reset(headers: httpx.Headers) -> Optional[str]:
+        """Reset delay of a rate limit window with no requests left, or None
+        
+        Hiro sends ratelimit-remaining/ratelimit-reset plus per-window
+        x-ratelimit-remaining-second/-minute counters; a spent window without a
+        reset header is waited out in full.
+        """
+        for name, value in headers.items():
+            if value.strip() != '0':
+                continue
+            if name in ('ratelimit-remaining', 'x-ratelimit-remaining'):
+                return headers.get('ratelimit-reset') or headers.get('x-ratelimit-reset')
+            if name.startswith('x-ratelimit-remaining-'):
+                window = RATE_LIMIT_WINDOWS.get(name.rsplit('-', 1)[-1])
+                if window:
+                    return headers.get('ratelimit-reset') or headers.get('x-ratelimit-reset') or str(window)
+        return None
+    
+    def _resume(self):
+        """Let requests through again unless a later pause superseded this one"""
+        if asyncio.get_running_loop().time() >= self._resume_at:
+            self._open.set()
+
+class TxCache:
+    """Persistent SQLite cache of Hiro responses, shared across runs and hunters
+
+    Address histories expire after `ttl` seconds; deployed contracts never change,
+    so their info is kept indefinitely. Empty histories are cached too, so
+    addresses without activity are not refetched. The connection is opened on
+    first use and reopened after close(), so pooled hunters can close it between
+    investigations.
+    """
+    
+    def __init__(self, path: str, ttl: int = TX_CACHE_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._db = None
+    
+    @property
+    def db(self) -> sqlite3.Connection:
+        """Connection to the cache database, opened (with its directory) on first use"""
+        if self._db is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._db = sqlite3.connect(self.path, isolation_level=None)  # Autocommit
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.executescript("""
+                CREATE TABLE IF NOT EXISTS tx (
+                    address TEXT PRIMARY KEY, fetched_at REAL, tx_limit INTEGER, results BLOB
+                );
+                CREATE TABLE IF NOT EXISTS contract (id TEXT PRIMARY KEY, data BLOB);
+            """)
+        return self._db
+    
+    def get_transactions(self, address: str, limit: int) -> Optional[List[Dict]]:
+        """Cached history for an address, or None if missing, stale or fetched with a smaller limit"""
+        row = self.db.execute(
+            'SELECT tx_limit, results FROM tx WHERE address = ? AND fetched_at >= ?',
+            (address, time.time() - self.ttl)
+        ).fetchone()
+        
+        if row is None or row[0] < limit:
+            return None
+        return orjson.loads(row[1])[:limit]
+    
+    def put_transactions(self, address: str, limit: int, results: List[Dict]):
+        """Store the history fetched for an address with the limit it was fetched with"""
+        self.db.execute(
+            'INSERT OR REPLACE INTO tx VALUES (?, ?, ?, ?)',
+            (address, time.time(), limit, orjson.dumps(results))
+        )
+    
+    def get_contract(self, contract_id: str) -> Optional[Dict]:
+        """Cached contract info, or None if not cached"""
+        row = self.db.execute('SELECT data FROM contract WHERE id = ?', (contract_id,)).fetchone()
+        return orjson.loads(row[0]) if row else None
+    
+    def put_contract(self, contract_id: str, data: Dict):
+        """Store contract info"""
+        self.db.execute('INSERT OR REPLACE INTO contract VALUES (?, ?)', (contract_id, orjson.dumps(data)))
+    
+    def close(self):
+        """Close the database connection; the next lookup reopens it"""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
 class WELSHFounderHunter:
     """
     Autonomous blockchain forensics agent for identifying WELSH token founder
     through wallet clustering and cross-chain analysis
     """
     
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, http_client: Optional[httpx.AsyncClient] = None):
         self.config = config
         self.hiro_api_base = "https://api.hiro.so"
-        self.session = requests.Session()
         
-        # Set API headers if key provided
-        if config.get('hiro_api_key'):
-            self.session.headers.update({
-                'X-API-Key': config['hiro_api_key']
-            })
+        # Reuse a shared connection pool across hunters if provided; otherwise a
+        # client is opened per investigation (see _get_session)
+        self._shared_session = http_client
+        self.session = http_client
+        
+        # Sent per request so hunters with different keys can share one client
+        self.headers = {'X-API-Key': config['hiro_api_key']} if config.get('hiro_api_key') else {}
+        
+        # Persistent response cache; disabled when no path is configured
+        cache_path = config.get('tx_cache_path')
+        self.tx_cache = TxCache(cache_path, config.get('tx_cache_ttl', TX_CACHE_TTL)) if cache_path else None
         
+        self.cex_tags = self._load_cex_tags()
+        self._cex_addresses = frozenset(self.cex_tags)  # Membership gate for the funding trace
+        
+        # Heuristic candidates by (address, tx ids) digest; kept across investigations
+        # since confirmed transactions never change
+        self._heuristics_cache = LRUCache(maxsize=HEURISTICS_CACHE_SIZE)
+        self._reset_investigation_state()
+        
+        print("🔍 WELSH-Founder Hunter initialized")
+        print(f"📊 Mission State: Phase {self.mission_state['phase']} - {self.mission_state['current_objective']}")
+    
+    def _reset_investigation_state(self):
+        """Start a fresh investigation so a hunter instance can be reused"""
         # Initialize data stores
-        self.wallet_graph = nx.DiGraph()
+        self.wallet_graph = defaultdict(set)  # Address -> addresses it links to
         self.clusters = {}
         self.evidence = []
-        self.cex_tags = self._load_cex_tags()
+        
+        # Columns of (weight index, confidence) per evidence item, filled by _add_evidence
+        self._evidence_type_ids = array('i')
+        self._evidence_confidences = array('d')
+        self.deployer_info = {}
+        self._tx_cache: Dict[str, asyncio.Future] = {}  # Address -> in-flight or finished history fetch
+        self._rate_limiter = RateLimiter(self.config.get('batch_size', DEFAULT_BATCH_SIZE))
         
         # Mission state tracking
         self.mission_state = {
@@ -62,9 +278,6 @@ class WELSHFounderHunter:
             'current_objective': 'Bootstrap',
             'evidence_score': 0
         }
-        
-        print("🔍 WELSH-Founder Hunter initialized")
-        print(f"📊 Mission State: Phase {self.mission_state['phase']} - {self.mission_state['current_objective']}")
     
     def _load_cex_tags(self) -> Dict[str, str]:
         """Load known CEX wallet tags"""
@@ -79,6 +292,35 @@ class WELSHFounderHunter:
             'SP32AEEF6WW5Y0NMJ1S8SBSZDAY8R5J32NBZFPKKZ': 'kucoin_hot_1'
         }
     
+    def _get_session(self) -> httpx.AsyncClient:
+        """Lazily open the pooled HTTP/2 client bound to the current event loop"""
+        if self.session is None or self.session.is_closed:
+            self.session = create_http_client(httpx.Limits(max_connections=64))
+        return self.session
+    
+    async def close(self):
+        """Close the hunter's own HTTP client and its cache connection; a shared client is
+        left open for its owner"""
+        if self.session not in (None, self._shared_session) and not self.session.is_closed:
+            await self.session.aclose()
+        self.session = self._shared_session
+        if self.tx_cache:
+            self.tx_cache.close()
+    
+    async def _get(self, url: str, params: Dict = None) -> httpx.Response:
+        """GET a Hiro API URL through the rate limiter, backing off on 429 and transient 5xx responses"""
+        for attempt in range(REQUEST_RETRIES):
+            async with self._rate_limiter:
+                response = await self._get_session().get(url, params=params, headers=self.headers)
+            paused = self._rate_limiter.update(response.headers)
+            
+            if response.status_code not in RETRY_STATUSES or attempt == REQUEST_RETRIES - 1:
+                break
+            if not paused:  # Otherwise the rate limiter is already holding the retry back
+                await asyncio.sleep(2 ** attempt + random.random())
+        
+        return response
+    
     def bootstrap(self, welsh_contract: str, arkadiko_wallets: List[str], 
                   philip_wallets: List[str] = None) -> bool:
         """Phase 0: Bootstrap - Load configuration and seed addresses"""
@@ -109,28 +351,33 @@ class WELSHFounderHunter:
             print(f"❌ Bootstrap failed: {e}")
             return False
     
-    def discover_deployer(self) -> Optional[Tuple[str, str]]:
+    async def discover_deployer(self) -> Optional[Tuple[str, str]]:
         """Phase 1: Identify original deployment transaction and deployer"""
         try:
             print("\n🔍 Phase 1: Deployer Discovery")
             
             # Get contract info to find deployment tx
-            url = f"{self.hiro_api_base}/extended/v1/contract/{self.welsh_contract}"
-            response = self.session.get(url)
-            
-            if response.status_code != 200:
-                print(f"❌ Failed to fetch contract info: {response.status_code}")
-                return None
+            contract_data = self.tx_cache.get_contract(self.welsh_contract) if self.tx_cache else None
             
-            contract_data = response.json()
+            if contract_data is None:
+                url = f"{self.hiro_api_base}/extended/v1/contract/{self.welsh_contract}"
+                response = await self._get(url)
+                
+                if response.status_code != 200:
+                    print(f"❌ Failed to fetch contract info: {response.status_code}")
+                    return None
+                
+                contract_data = orjson.loads(response.content)
+                if self.tx_cache:
+                    self.tx_cache.put_contract(self.welsh_contract, contract_data)
             deploy_tx = contract_data.get('tx_id')
             
             # Get full transaction details
             tx_url = f"{self.hiro_api_base}/extended/v1/tx/{deploy_tx}"
-            tx_response = self.session.get(tx_url)
+            tx_response = await self._get(tx_url)
             
             if tx_response.status_code == 200:
-                tx_data = tx_response.json()
+                tx_data = orjson.loads(tx_response.content)
                 deployer = tx_data.get('sender_address')
                 deploy_time = tx_data.get('burn_block_time_iso')
                 
@@ -154,44 +401,49 @@ class WELSHFounderHunter:
             print(f"❌ Deployer discovery failed: {e}")
             return None
     
-    def expand_wallet_cluster(self, seed_address: str, max_hops: int = 2) -> WalletCluster:
+    async def expand_wallet_cluster(self, seed_address: str, max_hops: int = 2) -> WalletCluster:
         """Phase 2: Build graph of wallets controlled by deployer using heuristics"""
         try:
             print(f"\n🕸️ Phase 2: Wallet-Cluster Expansion for {seed_address}")
             
             visited = set()
-            to_visit = [(seed_address, 0)]  # (address, hop_count)
-            related_addresses = set()
+            frontier = [seed_address]  # Addresses at the current hop
+            components = DSU()
             heuristics_found = []
             
-            while to_visit and len(visited) < 100:  # Safety limit
-                current_addr, hop_count = to_visit.pop(0)
+            # Breadth-first by hop: every address at one hop is fetched concurrently
+            for hop_count in range(max_hops + 1):
+                frontier = [addr for addr in dict.fromkeys(frontier) if addr not in visited]
+                frontier = frontier[:100 - len(visited)]  # Safety limit
+                if not frontier:
+                    break
                 
-                if current_addr in visited or hop_count > max_hops:
-                    continue
-                    
-                visited.add(current_addr)
-                print(f"  🔍 Analyzing {current_addr} (hop {hop_count})")
+                visited.update(frontier)
+                for current_addr in frontier:
+                    print(f"  🔍 Analyzing {current_addr} (hop {hop_count})")
                 
                 # Get transaction history
-                txs = self._get_address_transactions(current_addr)
+                histories = await asyncio.gather(*(self._get_address_transactions(addr, limit=50) for addr in frontier))
                 
-                # Apply clustering heuristics
-                cluster_candidates = self._apply_clustering_heuristics(current_addr, txs)
-                
-                for candidate, heuristic in cluster_candidates:
-                    if candidate not in visited:
-                        related_addresses.add(candidate)
-                        heuristics_found.append(heuristic)
+                next_frontier = []
+                for current_addr, txs in zip(frontier, histories):
+                    # Apply clustering heuristics
+                    cluster_candidates = self._apply_clustering_heuristics(current_addr, txs)
+                    
+                    for candidate, heuristic in cluster_candidates:
+                        if candidate not in visited:
+                            heuristics_found.append(heuristic)
                         
-                        if hop_count < max_hops:
-                            to_visit.append((candidate, hop_count + 1))
-                
-                # Add edges to graph
-                for candidate, _ in cluster_candidates:
-                    self.wallet_graph.add_edge(current_addr, candidate)
+                        # Only addresses new to the cluster are expanded further
+                        if components.union(current_addr, candidate) and hop_count < max_hops:
+                            next_frontier.append(candidate)
+                    
+                    # Add edges to graph
+                    self.wallet_graph[current_addr].update(candidate for candidate, _ in cluster_candidates)
                 
-                time.sleep(0.1)  # Rate limiting
+                frontier = next_frontier
+            
+            related_addresses = components.component(seed_address) - {seed_address}
             
             # Calculate confidence score
             confidence = self._calculate_cluster_confidence(related_addresses, heuristics_found)
@@ -217,64 +469,130 @@ class WELSHFounderHunter:
             print(f"❌ Wallet clustering failed: {e}")
             return None
     
-    def _get_address_transactions(self, address: str, limit: int = 50) -> List[Dict]:
-        """Get transaction history for an address"""
+    async def _get_address_transactions(self, address: str, limit: int = TX_FETCH_LIMIT) -> List[Dict]:
+        """Get transaction history for an address; all phases share one fetch per address"""
+        fetch = self._tx_cache.get(address)
+        if fetch is None:
+            fetch = self._tx_cache[address] = asyncio.ensure_future(self._fetch_address_transactions(address))
+        
+        results = await fetch
+        if results is None:
+            # Failed fetches are dropped so a later phase tries again
+            if self._tx_cache.get(address) is fetch:
+                del self._tx_cache[address]
+            return []
+        return results[:limit]
+    
+    async def _fetch_address_transactions(self, address: str) -> Optional[List[Dict]]:
+        """Fetch the largest history any phase needs, or None if the request failed"""
         try:
+            if self.tx_cache:
+                cached = self.tx_cache.get_transactions(address, TX_FETCH_LIMIT)
+                if cached is not None:
+                    return self._intern_addresses(cached)
+            
             url = f"{self.hiro_api_base}/extended/v1/address/{address}/transactions"
-            params = {'limit': limit}
-            response = self.session.get(url, params=params)
+            response = await self._get(url, params={'limit': TX_PAGE_LIMIT})
             
             if response.status_code == 200:
-                return response.json().get('results', [])
-            return []
+                page = orjson.loads(response.content)
+                results = page.get('results', [])
+                total = min(page.get('total') or 0, TX_FETCH_LIMIT)
+            elif response.status_code == 404:
+                results, total = [], 0  # Unknown address: cached as an empty history
+            else:
+                return None
+            
+            # Read further pages until TX_FETCH_LIMIT or the end of the history
+            while len(results) < total:
+                response = await self._get(url, params={'limit': TX_PAGE_LIMIT, 'offset': len(results)})
+                if response.status_code != 200:
+                    return None
+                page = orjson.loads(response.content).get('results', [])
+                if not page:
+                    break
+                results.extend(page)
+            results = results[:TX_FETCH_LIMIT]
+            
+            if self.tx_cache:
+                self.tx_cache.put_transactions(address, TX_FETCH_LIMIT, results)
+            return self._intern_addresses(results)
             
         except Exception as e:
             print(f"⚠️ Failed to get transactions for {address}: {e}")
-            return []
+            return None
+    
+    def _intern_addresses(self, transactions: List[Dict]) -> List[Dict]:
+        """Intern address fields in place so each address is one shared string across
+        histories, graph, clusters and evidence"""
+        for tx in transactions:
+            for field in ('sender_address', 'recipient_address'):
+                if tx.get(field):
+                    tx[field] = sys.intern(tx[field])
+            
+            transfer = tx.get('token_transfer')
+            if transfer and transfer.get('recipient_address'):
+                transfer['recipient_address'] = sys.intern(transfer['recipient_address'])
+        return transactions
     
     def _apply_clustering_heuristics(self, address: str, transactions: List[Dict]) -> List[Tuple[str, str]]:
         """Apply wallet clustering heuristics"""
-        candidates = []
-        
-        # Heuristic 1: Common input ownership (multiple inputs in same tx)
-        for tx in transactions:
-            if tx.get('tx_type') == 'token_transfer':
-                # Look for transactions with multiple STX inputs
-                inputs = tx.get('stx_sent', 0)
-                if inputs > 0:
-                    sender = tx.get('sender_address')
-                    if sender and sender != address:
-                        candidates.append((sender, 'common_input_ownership'))
-        
-        # Heuristic 2: Round number transfers (likely internal)
-        for tx in transactions:
-            amount = tx.get('stx_sent', 0)
-            if amount and amount % 1000000 == 0:  # Round STX amounts
-                recipient = tx.get('recipient_address')
-                if recipient:
-                    candidates.append((recipient, 'round_number_transfer'))
-        
-        # Heuristic 3: Timing correlation (transactions within minutes)
-        tx_times = [(tx.get('burn_block_time'), tx.get('sender_address')) for tx in transactions]
-        for i, (time1, addr1) in enumerate(tx_times):
-            for time2, addr2 in tx_times[i+1:]:
-                if addr1 != addr2 and abs(time1 - time2) < 300:  # 5 minutes
-                    candidates.append((addr2, 'timing_correlation'))
+        # The same address and transactions always yield the same candidates
+        key = hashlib.blake2b(
+            b'\0'.join([address.encode(), *sorted(str(tx.get('tx_id')).encode() for tx in transactions)]),
+            digest_size=16
+        ).digest()
+        cached = self._heuristics_cache.get(key)
+        if cached is not None:
+            return cached
         
-        # Heuristic 4: Fee pattern similarity
+        common_inputs = []
+        round_transfers = []
+        tx_times = []
         fee_patterns = defaultdict(list)
-        for tx in transactions:
-            fee = tx.get('fee_rate', 0)
+        
+        # One pass over the history pulls out the fields every heuristic reads
+        for index, tx in enumerate(transactions):
             sender = tx.get('sender_address')
+            amount = tx.get('stx_sent', 0)
+            
+            # Heuristic 1: Common input ownership (token transfers with STX inputs)
+            if tx.get('tx_type') == 'token_transfer' and amount > 0 and sender and sender != address:
+                common_inputs.append((sender, 'common_input_ownership'))
+            
+            # Heuristic 2: Round number transfers (likely internal)
+            if amount and amount % 1000000 == 0 and tx.get('recipient_address'):  # Round STX amounts
+                round_transfers.append((tx['recipient_address'], 'round_number_transfer'))
+            
+            if tx.get('burn_block_time') is not None:
+                tx_times.append((tx['burn_block_time'], index, sender))
+            
+            fee = tx.get('fee_rate', 0)
             if fee and sender:
                 fee_patterns[fee].append(sender)
         
+        candidates = common_inputs + round_transfers
+        
+        # Heuristic 3: Timing correlation (transactions within minutes), swept in time order
+        # so each transaction is only compared with those in the 5 minute window before it
+        tx_times.sort()
+        window_start = 0
+        for position, (time2, index2, addr2) in enumerate(tx_times):
+            while time2 - tx_times[window_start][0] >= 300:
+                window_start += 1
+            for time1, index1, addr1 in tx_times[window_start:position]:
+                if addr1 != addr2:
+                    # Credited to whichever transaction comes later in the history
+                    candidates.append((addr2 if index2 > index1 else addr1, 'timing_correlation'))
+        
+        # Heuristic 4: Fee pattern similarity
         for fee, senders in fee_patterns.items():
             if len(senders) > 1:
                 for sender in senders:
                     if sender != address:
                         candidates.append((sender, 'fee_pattern_similarity'))
         
+        self._heuristics_cache[key] = candidates
         return candidates
     
     def _calculate_cluster_confidence(self, addresses: Set[str], heuristics: List[str]) -> float:
@@ -292,26 +610,27 @@ class WELSHFounderHunter:
         
         return min(base_score + heuristic_score, 100) / 100
     
-    def trace_funding_sources(self, cluster: WalletCluster) -> List[Dict]:
+    async def trace_funding_sources(self, cluster: WalletCluster) -> List[Dict]:
         """Phase 3: Follow STX inputs that funded gas fees & LP wallet"""
         try:
             print("\n💰 Phase 3: Funding-Source Trace")
             
             funding_sources = []
+            addresses = [cluster.primary_address, *cluster.related_addresses]
             
-            for address in [cluster.primary_address] | cluster.related_addresses:
+            # Get incoming STX transfers for every cluster address at once
+            histories = await asyncio.gather(*(self._get_address_transactions(addr) for addr in addresses))
+            
+            for address, txs in zip(addresses, histories):
                 print(f"  🔍 Tracing funding for {address}")
                 
-                # Get incoming STX transfers
-                txs = self._get_address_transactions(address, limit=100)
-                
                 for tx in txs:
                     if tx.get('tx_type') == 'token_transfer' and tx.get('token_transfer', {}).get('recipient_address') == address:
                         sender = tx.get('sender_address')
                         amount = tx.get('token_transfer', {}).get('amount', 0)
                         
                         # Check if sender is a known CEX
-                        cex_label = self.cex_tags.get(sender)
+                        cex_label = self.cex_tags[sender] if sender in self._cex_addresses else None
                         
                         funding_info = {
                             'recipient': address,
@@ -336,9 +655,7 @@ class WELSHFounderHunter:
                                 timestamp=datetime.now(),
                                 source_data=funding_info
                             )
-                            self.evidence.append(evidence)
-                
-                time.sleep(0.1)  # Rate limiting
+                            self._add_evidence(evidence)
             
             print(f"✅ Found {len(funding_sources)} funding sources")
             print(f"✅ Found {len([f for f in funding_sources if f['is_cex']])} CEX sources")
@@ -350,12 +667,12 @@ class WELSHFounderHunter:
             print(f"❌ Funding source trace failed: {e}")
             return []
     
-    def scan_arkadiko_overlap(self, cluster: WalletCluster) -> Dict:
+    async def scan_arkadiko_overlap(self, cluster: WalletCluster) -> Dict:
         """Phase 4: Look for links between founder cluster & Arkadiko ops wallets"""
         try:
             print("\n🔗 Phase 4: Arkadiko Overlap Scan")
             
-            cluster_addresses = {cluster.primary_address} | cluster.related_addresses
+            cluster_addresses = frozenset({cluster.primary_address} | cluster.related_addresses)
             overlaps = []
             
             # Get Arkadiko contract interactions
@@ -365,45 +682,39 @@ class WELSHFounderHunter:
                 'SP2C2YFP12AJZB4MABJBAJ55XECVS7E4PMMZ89YZR.arkadiko-vault-manager-v1-1'
             ]
             
-            for contract in arkadiko_contracts:
+            # Get contract call events by cluster wallets for all contracts at once
+            contract_events = await asyncio.gather(*(
+                self._get_cluster_events(contract, cluster_addresses) for contract in arkadiko_contracts
+            ))
+            
+            for contract, events in zip(arkadiko_contracts, contract_events):
                 print(f"  🔍 Checking interactions with {contract}")
                 
-                # Get contract call events
-                url = f"{self.hiro_api_base}/extended/v1/contract/{contract}/events"
-                response = self.session.get(url, params={'limit': 100})
-                
-                if response.status_code == 200:
-                    events = response.json().get('results', [])
+                for event in events:
+                    caller = event['tx']['sender_address']
+                    overlap_info = {
+                        'cluster_address': caller,
+                        'arkadiko_contract': contract,
+                        'tx_id': event['tx'].get('tx_id'),
+                        'event_type': event.get('event_type'),
+                        'timestamp': event['tx'].get('burn_block_time_iso')
+                    }
+                    overlaps.append(overlap_info)
                     
-                    for event in events:
-                        caller = event.get('tx', {}).get('sender_address')
-                        
-                        if caller in cluster_addresses:
-                            overlap_info = {
-                                'cluster_address': caller,
-                                'arkadiko_contract': contract,
-                                'tx_id': event.get('tx', {}).get('tx_id'),
-                                'event_type': event.get('event_type'),
-                                'timestamp': event.get('tx', {}).get('burn_block_time_iso')
-                            }
-                            overlaps.append(overlap_info)
-                            
-                            print(f"  🎯 Found overlap: {caller} -> {contract}")
-                            
-                            # Add evidence
-                            evidence = Evidence(
-                                evidence_type='arkadiko_interaction',
-                                description=f'Cluster wallet interacted with Arkadiko contract',
-                                confidence=0.6,
-                                timestamp=datetime.now(),
-                                source_data=overlap_info
-                            )
-                            self.evidence.append(evidence)
-                
-                time.sleep(0.2)  # Rate limiting
+                    print(f"  🎯 Found overlap: {caller} -> {contract}")
+                    
+                    # Add evidence
+                    evidence = Evidence(
+                        evidence_type='arkadiko_interaction',
+                        description=f'Cluster wallet interacted with Arkadiko contract',
+                        confidence=0.6,
+                        timestamp=datetime.now(),
+                        source_data=overlap_info
+                    )
+                    self._add_evidence(evidence)
             
             # Check for shared UTXO partners
-            jaccard_scores = self._calculate_jaccard_similarity(cluster_addresses)
+            jaccard_scores = await self._calculate_jaccard_similarity(cluster_addresses)
             
             overlap_result = {
                 'direct_overlaps': overlaps,
@@ -421,39 +732,71 @@ class WELSHFounderHunter:
             print(f"❌ Arkadiko overlap scan failed: {e}")
             return {}
     
-    def _calculate_jaccard_similarity(self, cluster_addresses: Set[str]) -> Dict[str, float]:
+    async def _get_cluster_events(self, contract: str, cluster_addresses: frozenset) -> List[Dict]:
+        """A contract's events called by cluster wallets, scanning the first page then the
+        rest (up to MAX_CONTRACT_EVENTS) at once"""
+        url = f"{self.hiro_api_base}/extended/v1/contract/{contract}/events"
+        first_page = await self._get_event_page(url, {'limit': EVENT_PAGE_LIMIT}, cluster_addresses)
+        if first_page is None:
+            return []
+        
+        # Step by the page size the API honoured, which may be below the requested limit
+        page_size, total, matched = first_page
+        total = min(total, MAX_CONTRACT_EVENTS)
+        if not page_size or total <= page_size:
+            return matched
+        
+        pages = await asyncio.gather(*(
+            self._get_event_page(url, {'limit': page_size, 'offset': offset}, cluster_addresses)
+            for offset in range(page_size, total, page_size)
+        ))
+        for page in pages:
+            if page is not None:
+                matched.extend(page[2])
+        return matched
+    
+    async def _get_event_page(self, url: str, params: Dict,
+                              cluster_addresses: frozenset) -> Optional[Tuple[int, int, List[Dict]]]:
+        """One page of contract events as (page size, total, events called by cluster wallets)
+
+        Pages are filtered as they arrive, so only matching events outlive the response.
+        """
+        response = await self._get(url, params=params)
+        if response.status_code != 200:
+            return None
+        
+        page = orjson.loads(response.content)
+        events = page.get('results', [])
+        matched = [event for event in events if event.get('tx', {}).get('sender_address') in cluster_addresses]
+        return page.get('limit') or len(events), page.get('total') or 0, matched
+    
+    def _transaction_partners(self, address: str, transactions: List[Dict]) -> Set[str]:
+        """Addresses on the other side of an address's transactions"""
+        senders = {tx.get('sender_address') for tx in transactions}
+        recipients = {tx.get('recipient_address') for tx in transactions}
+        return (senders | recipients) - {address}
+    
+    async def _calculate_jaccard_similarity(self, cluster_addresses: Set[str]) -> Dict[str, float]:
         """Calculate Jaccard similarity between cluster and Arkadiko wallets"""
-        scores = {}
+        # This is simplified - in production, implement full UTXO partner analysis
+        cluster_list = list(cluster_addresses)
+        arkadiko_list = list(self.arkadiko_wallets)
+        histories = await asyncio.gather(*(
+            self._get_address_transactions(addr, limit=20) for addr in cluster_list + arkadiko_list
+        ))
         
-        for arkadiko_addr in self.arkadiko_wallets:
-            # Get transaction partners for both sets
-            cluster_partners = set()
-            arkadiko_partners = set()
-            
-            # This is simplified - in production, implement full UTXO partner analysis
-            for addr in cluster_addresses:
-                txs = self._get_address_transactions(addr, limit=20)
-                for tx in txs:
-                    if tx.get('sender_address') != addr:
-                        cluster_partners.add(tx.get('sender_address'))
-                    if tx.get('recipient_address') != addr:
-                        cluster_partners.add(tx.get('recipient_address'))
-            
-            txs = self._get_address_transactions(arkadiko_addr, limit=20)
-            for tx in txs:
-                if tx.get('sender_address') != arkadiko_addr:
-                    arkadiko_partners.add(tx.get('sender_address'))
-                if tx.get('recipient_address') != arkadiko_addr:
-                    arkadiko_partners.add(tx.get('recipient_address'))
+        # The cluster's partners are the same for every Arkadiko wallet, so they are collected once
+        cluster_partners = set().union(*(
+            self._transaction_partners(addr, txs) for addr, txs in zip(cluster_list, histories)
+        ))
+        
+        scores = {}
+        for arkadiko_addr, txs in zip(arkadiko_list, histories[len(cluster_list):]):
+            arkadiko_partners = self._transaction_partners(arkadiko_addr, txs)
             
             # Calculate Jaccard similarity
-            intersection = len(cluster_partners & arkadiko_partners)
             union = len(cluster_partners | arkadiko_partners)
-            
-            if union > 0:
-                scores[arkadiko_addr] = intersection / union
-            else:
-                scores[arkadiko_addr] = 0.0
+            scores[arkadiko_addr] = len(cluster_partners & arkadiko_partners) / union if union else 0.0
         
         return scores
     
@@ -497,6 +840,12 @@ class WELSHFounderHunter:
             'correlation_score': 0.0
         }
     
+    def _add_evidence(self, evidence: Evidence):
+        """Record an evidence item along with its scoring columns"""
+        self.evidence.append(evidence)
+        self._evidence_type_ids.append(_EVIDENCE_TYPE_INDEX.get(evidence.evidence_type, len(EVIDENCE_WEIGHTS)))
+        self._evidence_confidences.append(evidence.confidence)
+    
     def score_evidence(self) -> float:
         """Phase 6: Quantify strength of proof using weighted scoring"""
         try:
@@ -505,25 +854,16 @@ class WELSHFounderHunter:
             total_score = 0
             max_possible = 100
             
-            # Scoring weights as per spec
-            weights = {
-                'cex_funding': 40,
-                'arkadiko_interaction': 25,
-                'fee_pattern': 15,
-                'stylometry': 10,
-                'timing_correlation': 10
-            }
+            # Apply weights to all evidence at once: gather each item's weight, times its confidence
+            type_ids = np.frombuffer(self._evidence_type_ids, dtype=np.intc)
+            contributions = _EVIDENCE_WEIGHT_VECTOR[type_ids] * np.frombuffer(self._evidence_confidences)
+            total_score += float(contributions.sum())
             
             evidence_summary = defaultdict(list)
             
-            for evidence in self.evidence:
+            for evidence, score_contribution in zip(self.evidence, contributions.tolist()):
                 evidence_summary[evidence.evidence_type].append(evidence)
                 
-                # Apply weights
-                weight = weights.get(evidence.evidence_type, 5)
-                score_contribution = weight * evidence.confidence
-                total_score += score_contribution
-                
                 print(f"  📋 {evidence.evidence_type}: {evidence.confidence:.2f} confidence, {score_contribution:.1f} points")
             
             # Normalize to percentage
@@ -546,7 +886,7 @@ class WELSHFounderHunter:
                 'total_score': confidence_percentage,
                 'conclusion': conclusion,
                 'evidence_breakdown': dict(evidence_summary),
-                'scoring_weights': weights
+                'scoring_weights': EVIDENCE_WEIGHTS
             }
             
             self._update_mission_state(7, 'Report Generation')
@@ -618,6 +958,10 @@ This analysis employed blockchain forensics techniques including:
 - **Heuristics Applied:** {', '.join(set(cluster.heuristics))}
 """
         
+        # Graph nodes include addresses that only appear as link targets
+        graph_nodes = set(self.wallet_graph).union(*self.wallet_graph.values())
+        graph_edges = sum(len(targets) for targets in self.wallet_graph.values())
+        
         # Add evidence breakdown
         report += f"""
 ## Evidence Analysis
@@ -638,8 +982,8 @@ This analysis employed blockchain forensics techniques including:
 - **Evidence Items:** {len(self.evidence)}
 
 ### Graph Statistics
-- **Nodes:** {self.wallet_graph.number_of_nodes()}
-- **Edges:** {self.wallet_graph.number_of_edges()}
+- **Nodes:** {len(graph_nodes)}
+- **Edges:** {graph_edges}
 
 ## Disclaimer
 This analysis is based on publicly available blockchain data and should not be considered definitive proof of identity. Legal verification may require additional investigation and formal procedures.
@@ -661,7 +1005,16 @@ This analysis is based on publicly available blockchain data and should not be c
     def run_full_investigation(self, welsh_contract: str, arkadiko_wallets: List[str], 
                              philip_wallets: List[str] = None) -> Dict:
         """Execute complete investigation pipeline"""
+        return asyncio.run(self.run_full_investigation_async(
+            welsh_contract, arkadiko_wallets, philip_wallets
+        ))
+    
+    async def run_full_investigation_async(self, welsh_contract: str, arkadiko_wallets: List[str], 
+                                           philip_wallets: List[str] = None) -> Dict:
+        """Async variant of run_full_investigation for callers already in an event loop"""
         try:
+            self._reset_investigation_state()
+            
             print("🚀 Starting WELSH-Founder Hunter Investigation")
             print("=" * 60)
             
@@ -670,22 +1023,22 @@ This analysis is based on publicly available blockchain data and should not be c
                 return {'success': False, 'error': 'Bootstrap failed'}
             
             # Phase 1: Deployer Discovery
-            deployer_info = self.discover_deployer()
+            deployer_info = await self.discover_deployer()
             if not deployer_info:
                 return {'success': False, 'error': 'Deployer discovery failed'}
             
             deployer_address, deploy_tx = deployer_info
             
             # Phase 2: Wallet Clustering
-            cluster = self.expand_wallet_cluster(deployer_address)
+            cluster = await self.expand_wallet_cluster(deployer_address)
             if not cluster:
                 return {'success': False, 'error': 'Wallet clustering failed'}
             
             # Phase 3: Funding Source Trace
-            funding_sources = self.trace_funding_sources(cluster)
+            funding_sources = await self.trace_funding_sources(cluster)
             
             # Phase 4: Arkadiko Overlap
-            arkadiko_overlap = self.scan_arkadiko_overlap(cluster)
+            arkadiko_overlap = await self.scan_arkadiko_overlap(cluster)
             
             # Phase 5: Off-chain Correlation
             offchain_data = self.correlate_offchain_data()
@@ -713,6 +1066,18 @@ This analysis is based on publicly available blockchain data and should not be c
         except Exception as e:
             print(f"❌ Investigation failed: {e}")
             return {'success': False, 'error': str(e)}
+        
+        finally:
+            await self.close()
+
+def create_http_client(limits: httpx.Limits) -> httpx.AsyncClient:
+    """Pooled HTTP/2 client for Hiro requests with connect/read timeouts and connection retries"""
+    # HTTP/2 multiplexes a batch of concurrent requests over one TLS connection; failed
+    # connects are retried by the transport, bad statuses by WELSHFounderHunter._get
+    return httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(http2=True, limits=limits, retries=REQUEST_RETRIES),
+        timeout=httpx.Timeout(30, connect=3.05)
+    )
 
 # Example usage and configuration
 def create_welsh_hunter_config():
@@ -724,6 +1089,9 @@ def create_welsh_hunter_config():
         'subpoena_mode': False,  # Legal escalation toggle
         'max_cluster_size': 50,
         'analysis_depth': 2,
+        'batch_size': DEFAULT_BATCH_SIZE,  # Concurrent Hiro requests; larger batches risk head-of-line blocking
+        'tx_cache_path': os.getenv('TX_CACHE_PATH', DEFAULT_TX_CACHE_PATH),  # None or '' disables the persistent response cache
+        'tx_cache_ttl': TX_CACHE_TTL,
         'confidence_threshold': 70
     }
 
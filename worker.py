@@ -0,0 +1,114 @@
+# WELSH-Founder Hunter - Investigation Worker
+# arq worker that runs investigations queued by the REST API
+#
+# Run with: arq worker.WorkerSettings
+
+import asyncio
+import hashlib
+import os
+from functools import lru_cache
+from typing import Dict, List
+import orjson
+from arq.connections import RedisSettings
+import httpx
+from cachetools import LRUCache
+from welsh_hunter import WELSHFounderHunter, create_http_client, create_welsh_hunter_config
+from investigation_store import REDIS_URL, RESULT_FIELDS, create_redis_client, save_investigation
+
+HIRO_API_BASE = 'https://api.hiro.so'
+HTTP_POOL_SIZE = 100  # Connections in the HTTP client shared by all investigations
+HUNTER_POOL_SIZE = int(os.getenv('HUNTER_POOL_SIZE', 5))  # Warm hunters kept per config
+HUNTER_POOL_CONFIGS = 16  # Distinct configs with warm hunters kept per worker
+
+@lru_cache(maxsize=1)
+def _base_config() -> Dict:
+    """Default hunter configuration, built once per worker process (do not mutate)"""
+    return create_welsh_hunter_config()
+
+def _config_key(config: Dict) -> bytes:
+    """Stable digest of a hunter config so identical configs share warm hunters"""
+    return hashlib.blake2b(
+        orjson.dumps(config, option=orjson.OPT_SORT_KEYS, default=str),
+        digest_size=16
+    ).digest()
+
+def _checkout_hunter(ctx: Dict, config: Dict) -> WELSHFounderHunter:
+    """Take a warm hunter for this config from its pool, or build a new one"""
+    pool = ctx['hunter_pools'].get(_config_key(config))
+
+    if pool is not None and not pool.empty():
+        return pool.get_nowait()
+
+    return WELSHFounderHunter(config, http_client=ctx['http_client'])
+
+def _checkin_hunter(ctx: Dict, hunter: WELSHFounderHunter):
+    """Return a hunter to the pool for its config, dropping it if the pool is full"""
+    key = _config_key(hunter.config)
+    pool = ctx['hunter_pools'].get(key)
+
+    if pool is None:
+        pool = ctx['hunter_pools'][key] = asyncio.Queue(maxsize=HUNTER_POOL_SIZE)
+    if not pool.full():
+        pool.put_nowait(hunter)
+
+async def run_investigation(ctx: Dict, investigation_id: str, welsh_contract: str,
+                            arkadiko_wallets: List[str], philip_wallets: List[str],
+                            config_overrides: Dict):
+    """Run a queued investigation and record its outcome in the store"""
+    store = ctx['store']
+
+    try:
+        await save_investigation(store, investigation_id, 'running')
+
+        # Create configuration (the cached defaults are shared when nothing is overridden)
+        config = {**_base_config(), **config_overrides} if config_overrides else _base_config()
+        hunter = _checkout_hunter(ctx, config)
+
+        try:
+            # Hunter requests are awaited on this loop, so concurrent jobs interleave
+            result = await hunter.run_full_investigation_async(
+                welsh_contract=welsh_contract,
+                arkadiko_wallets=arkadiko_wallets,
+                philip_wallets=philip_wallets
+            )
+        finally:
+            _checkin_hunter(ctx, hunter)
+
+        result = {field: result.get(field) for field in RESULT_FIELDS}
+        await save_investigation(store, investigation_id, 'completed', result)
+
+    except Exception as e:
+        await save_investigation(store, investigation_id, 'failed', {
+            'success': False,
+            'error': str(e)
+        })
+
+async def startup(ctx: Dict):
+    """Open the investigation store connection, shared HTTP pool and hunter pool"""
+    ctx['store'] = create_redis_client()
+    ctx['http_client'] = create_http_client(
+        httpx.Limits(max_connections=HTTP_POOL_SIZE, max_keepalive_connections=HTTP_POOL_SIZE)
+    )
+    
+    # Pay the TLS handshake once up front; the first job then starts on a warm connection
+    try:
+        await ctx['http_client'].head(HIRO_API_BASE)
+    except httpx.HTTPError:
+        pass  # The first investigation connects instead
+
+    ctx['hunter_pools'] = LRUCache(maxsize=HUNTER_POOL_CONFIGS)
+    for _ in range(HUNTER_POOL_SIZE):
+        _checkin_hunter(ctx, WELSHFounderHunter(_base_config(), http_client=ctx['http_client']))
+
+async def shutdown(ctx: Dict):
+    """Close the investigation store connection and shared HTTP pool"""
+    await ctx['http_client'].aclose()
+    await ctx['store'].aclose()
+
+class WorkerSettings:
+    """arq worker configuration"""
+    functions = [run_investigation]
+    on_startup = startup
+    on_shutdown = shutdown
+    redis_settings = RedisSettings.from_dsn(REDIS_URL)
+    job_timeout = 3600  # Matches the agent timeout in softgen-config.yaml